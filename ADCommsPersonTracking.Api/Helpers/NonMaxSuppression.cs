@@ -0,0 +1,132 @@
+using System.Runtime.CompilerServices;
+using ADCommsPersonTracking.Api.Models;
+
+namespace ADCommsPersonTracking.Api.Helpers;
+
+/// <summary>
+/// Greedy non-maximum suppression over flat coordinate arrays.
+/// </summary>
+public static class NonMaxSuppression
+{
+    // Two overlapping boxes and one separate box, so warmup exercises both the keep and suppress paths
+    private static readonly BoundingBox[] WarmupBoxes =
+    {
+        new() { X = 0, Y = 0, Width = 100, Height = 100, Confidence = 0.9f },
+        new() { X = 10, Y = 10, Width = 100, Height = 100, Confidence = 0.8f },
+        new() { X = 300, Y = 300, Width = 50, Height = 50, Confidence = 0.7f }
+    };
+
+    /// <summary>
+    /// Run greedy NMS and return the indices of the kept boxes, highest confidence first.
+    /// A box is suppressed when its IoU with an already kept box is at least <paramref name="iouThreshold"/>.
+    /// </summary>
+    public static List<int> Apply(IReadOnlyList<BoundingBox> boxes, float iouThreshold)
+    {
+        var count = boxes.Count;
+        var x = new float[count];
+        var y = new float[count];
+        var widths = new float[count];
+        var heights = new float[count];
+        var scores = new float[count];
+        for (int i = 0; i < count; i++)
+        {
+            var box = boxes[i];
+            x[i] = box.X;
+            y[i] = box.Y;
+            widths[i] = box.Width;
+            heights[i] = box.Height;
+            scores[i] = box.Confidence;
+        }
+
+        return Apply(x, y, widths, heights, scores, iouThreshold);
+    }
+
+    /// <summary>
+    /// Same as above for boxes given as parallel arrays of top-left corners, sizes and scores,
+    /// so callers can run NMS before creating any <see cref="BoundingBox"/> objects.
+    /// </summary>
+    [MethodImpl(MethodImplOptions.AggressiveOptimization)]
+    public static List<int> Apply(ReadOnlySpan<float> x, ReadOnlySpan<float> y, ReadOnlySpan<float> widths,
+        ReadOnlySpan<float> heights, ReadOnlySpan<float> scores, float iouThreshold)
+    {
+        var count = scores.Length;
+        if (x.Length != count || y.Length != count || widths.Length != count || heights.Length != count)
+        {
+            throw new ArgumentException("All box spans must have the same length");
+        }
+
+        var kept = new List<int>();
+        if (count == 0)
+        {
+            return kept;
+        }
+
+        var confidences = scores.ToArray();
+        var order = new int[count];
+        for (int i = 0; i < count; i++)
+        {
+            order[i] = i;
+        }
+
+        // Highest confidence first; ties keep input order so results are deterministic
+        Array.Sort(order, (a, b) =>
+        {
+            var byConfidence = confidences[b].CompareTo(confidences[a]);
+            return byConfidence != 0 ? byConfidence : a.CompareTo(b);
+        });
+
+        // Corner coordinates and areas as flat arrays in score order, computed once instead of per
+        // IoU check, so the boxes a kept box can suppress form one contiguous run for SIMD IoU
+        var x1 = new float[count];
+        var y1 = new float[count];
+        var x2 = new float[count];
+        var y2 = new float[count];
+        var areas = new float[count];
+        for (int i = 0; i < count; i++)
+        {
+            var index = order[i];
+            x1[i] = x[index];
+            y1[i] = y[index];
+            x2[i] = x[index] + widths[index];
+            y2[i] = y[index] + heights[index];
+            areas[i] = widths[index] * heights[index];
+        }
+
+        var suppressed = new bool[count];
+        var ious = new float[count];
+        for (int i = 0; i < count; i++)
+        {
+            if (suppressed[i])
+            {
+                continue;
+            }
+
+            kept.Add(order[i]);
+
+            // Only boxes after the current one in score order can still be suppressed by it
+            var rest = i + 1;
+            var remaining = count - rest;
+            SimdMath.CalculateIoUs(x1[i], y1[i], x2[i], y2[i], areas[i],
+                x1.AsSpan(rest, remaining), y1.AsSpan(rest, remaining), x2.AsSpan(rest, remaining),
+                y2.AsSpan(rest, remaining), areas.AsSpan(rest, remaining), ious.AsSpan(0, remaining));
+
+            for (int j = 0; j < remaining; j++)
+            {
+                if (ious[j] >= iouThreshold)
+                {
+                    suppressed[rest + j] = true;
+                }
+            }
+        }
+
+        return kept;
+    }
+
+    /// <summary>
+    /// Run the NMS kernel once on a few dummy boxes so it is compiled before the first request.
+    /// </summary>
+    public static void Warmup()
+    {
+        Apply(WarmupBoxes, 0.5f);
+    }
+}
@@ -0,0 +1,210 @@
+using System.Text.Json;
+using ADCommsPersonTracking.Api.Logging;
+using Microsoft.ML.OnnxRuntime;
+
+namespace ADCommsPersonTracking.Api.Helpers;
+
+/// <summary>
+/// Creates ONNX Runtime sessions using the execution provider hints the model export scripts
+/// write next to each model as <c>&lt;model&gt;.meta.json</c>, and the shared threading settings
+/// from the <c>OnnxRuntime</c> configuration section.
+/// </summary>
+public static class OnnxSessionFactory
+{
+    private const string HintsSuffix = ".meta.json";
+    private const string CpuExecutionProvider = "CPUExecutionProvider";
+    private const string ConfigurationSection = "OnnxRuntime";
+
+    /// <summary>
+    /// Create an inference session for the model, configured from its sidecar hints when present.
+    /// When the session runs on the CPU provider only, the pre-optimized ORT-format copy written
+    /// by the export (<c>&lt;stem&gt;.ort</c>) is preferred over the ONNX file.
+    /// </summary>
+    public static InferenceSession Create(string modelPath, IConfiguration configuration, ILogger logger)
+    {
+        using var options = CreateSessionOptions(modelPath, configuration, logger, out var enabledProviders);
+
+        // The ORT-format model is optimized for the CPU provider, so GPU providers load the ONNX file
+        var ortModelPath = Path.ChangeExtension(modelPath, ".ort");
+        if (enabledProviders.Count == 0 && ortModelPath != modelPath && File.Exists(ortModelPath))
+        {
+            try
+            {
+                var session = new InferenceSession(ortModelPath, options);
+                logger.LogOrtFormatModelLoaded(ortModelPath);
+                return session;
+            }
+            catch (OnnxRuntimeException ex)
+            {
+                // e.g. the ORT format was written by a newer ONNX Runtime than the one the API ships
+                logger.LogOrtFormatModelLoadFailed(ortModelPath, ex.Message);
+            }
+        }
+
+        return new InferenceSession(modelPath, options);
+    }
+
+    /// <summary>
+    /// Build session options with the execution provider chain listed in the model's sidecar hints,
+    /// or in <c>OnnxRuntime:ExecutionProviders</c> when that is configured.
+    /// Providers that are not available in the installed ONNX Runtime package are skipped, so the
+    /// session always falls back to the CPU provider.
+    /// </summary>
+    public static SessionOptions CreateSessionOptions(string modelPath, IConfiguration configuration, ILogger logger)
+    {
+        return CreateSessionOptions(modelPath, configuration, logger, out _);
+    }
+
+    /// <summary>
+    /// Build session options as above, also returning the non-CPU providers that were enabled.
+    /// </summary>
+    public static SessionOptions CreateSessionOptions(string modelPath, IConfiguration configuration, ILogger logger,
+        out List<string> enabledProviders)
+    {
+        var options = new SessionOptions
+        {
+            // Includes the layout (NCHWc) and quantized-operator fusions that are not baked into the .ort files
+            GraphOptimizationLevel = GraphOptimizationLevel.ORT_ENABLE_ALL
+        };
+        enabledProviders = new List<string>();
+
+        // 0 leaves ONNX Runtime's default of one thread per physical core
+        var intraOpThreads = configuration.GetValue($"{ConfigurationSection}:IntraOpNumThreads", 0);
+        if (intraOpThreads > 0)
+        {
+            options.IntraOpNumThreads = intraOpThreads;
+        }
+
+        // Parallel mode runs independent graph branches concurrently on the inter-op pool;
+        // YOLO graphs are mostly a single chain, so sequential stays the default
+        options.ExecutionMode = configuration.GetValue($"{ConfigurationSection}:ExecutionMode", ExecutionMode.ORT_SEQUENTIAL);
+        var interOpThreads = configuration.GetValue($"{ConfigurationSection}:InterOpNumThreads", 0);
+        if (interOpThreads > 0)
+        {
+            options.InterOpNumThreads = interOpThreads;
+        }
+
+        foreach (var (provider, providerOptions) in ResolveProviders(modelPath, configuration, logger))
+        {
+            // The CPU provider is always registered last by ONNX Runtime itself
+            if (provider == CpuExecutionProvider)
+            {
+                continue;
+            }
+
+            try
+            {
+                AppendExecutionProvider(options, provider, providerOptions);
+                enabledProviders.Add(provider);
+                logger.LogExecutionProviderEnabled(provider, modelPath);
+            }
+            catch (Exception ex)
+            {
+                logger.LogExecutionProviderUnavailable(provider, modelPath, ex.Message);
+            }
+        }
+
+        return options;
+    }
+
+    /// <summary>
+    /// The provider chain to try, in order. A configured <c>OnnxRuntime:ExecutionProviders</c> list
+    /// replaces the sidecar's order, keeping the sidecar's options for providers listed in both.
+    /// </summary>
+    public static List<(string Provider, Dictionary<string, string> Options)> ResolveProviders(
+        string modelPath, IConfiguration configuration, ILogger logger)
+    {
+        var hints = ReadProviderHints(modelPath, logger);
+        var configuredProviders = configuration.GetSection($"{ConfigurationSection}:ExecutionProviders").Get<string[]>();
+        if (configuredProviders == null || configuredProviders.Length == 0)
+        {
+            return hints;
+        }
+
+        return configuredProviders
+            .Select(provider => (provider, hints.FirstOrDefault(h => h.Provider == provider).Options ?? new Dictionary<string, string>()))
+            .ToList();
+    }
+
+    /// <summary>
+    /// Read the ordered (provider, options) pairs from <c>&lt;model&gt;.meta.json</c>.
+    /// Returns an empty list if the file is missing or cannot be parsed.
+    /// </summary>
+    public static List<(string Provider, Dictionary<string, string> Options)> ReadProviderHints(string modelPath, ILogger logger)
+    {
+        var providers = new List<(string, Dictionary<string, string>)>();
+        var hintsPath = modelPath + HintsSuffix;
+        if (!File.Exists(hintsPath))
+        {
+            return providers;
+        }
+
+        try
+        {
+            using var document = JsonDocument.Parse(File.ReadAllText(hintsPath));
+            if (!document.RootElement.TryGetProperty("providers", out var providerList))
+            {
+                return providers;
+            }
+
+            // Each entry is ["ProviderName", { "option": value, ... }]
+            foreach (var entry in providerList.EnumerateArray())
+            {
+                var name = entry[0].GetString();
+                if (string.IsNullOrEmpty(name))
+                {
+                    continue;
+                }
+
+                var providerOptions = new Dictionary<string, string>();
+                if (entry.GetArrayLength() > 1)
+                {
+                    foreach (var option in entry[1].EnumerateObject())
+                    {
+                        providerOptions[option.Name] = option.Value.ValueKind switch
+                        {
+                            JsonValueKind.True => "1",
+                            JsonValueKind.False => "0",
+                            JsonValueKind.String => option.Value.GetString()!,
+                            _ => option.Value.GetRawText()
+                        };
+                    }
+                }
+
+                providers.Add((name, providerOptions));
+            }
+        }
+        catch (Exception ex) when (ex is JsonException or InvalidOperationException or IndexOutOfRangeException)
+        {
+            logger.LogSessionHintsInvalid(hintsPath, ex.Message);
+            providers.Clear();
+        }
+
+        return providers;
+    }
+
+    private static void AppendExecutionProvider(SessionOptions options, string provider, Dictionary<string, string> providerOptions)
+    {
+        switch (provider)
+        {
+            case "TensorrtExecutionProvider":
+                using (var tensorRtOptions = new OrtTensorRTProviderOptions())
+                {
+                    tensorRtOptions.UpdateOptions(providerOptions);
+                    options.AppendExecutionProvider_Tensorrt(tensorRtOptions);
+                }
+                break;
+            case "CUDAExecutionProvider":
+                using (var cudaOptions = new OrtCUDAProviderOptions())
+                {
+                    cudaOptions.UpdateOptions(providerOptions);
+                    options.AppendExecutionProvider_CUDA(cudaOptions);
+                }
+                break;
+            default:
+                // Generic registration takes the short name, e.g. "OpenVINO" or "XNNPACK"
+                options.AppendExecutionProvider(provider.Replace("ExecutionProvider", string.Empty), providerOptions);
+                break;
+        }
+    }
+}
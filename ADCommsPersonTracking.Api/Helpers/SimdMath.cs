@@ -9,6 +9,20 @@ namespace ADCommsPersonTracking.Api.Helpers;
 /// </summary>
 public static class SimdMath
 {
+    private const float ByteToUnit = 1f / 255f;
+
+    // pshufb masks gathering one channel of 16 interleaved RGB pixels (48 bytes, three vectors) into
+    // one vector; 0x80 lanes come out as zero, so the three partial gathers can be OR-ed together
+    private static readonly Vector128<byte> RedFromFirst = Vector128.Create((byte)0, 3, 6, 9, 12, 15, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80);
+    private static readonly Vector128<byte> RedFromSecond = Vector128.Create((byte)0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 2, 5, 8, 11, 14, 0x80, 0x80, 0x80, 0x80, 0x80);
+    private static readonly Vector128<byte> RedFromThird = Vector128.Create((byte)0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 1, 4, 7, 10, 13);
+    private static readonly Vector128<byte> GreenFromFirst = Vector128.Create((byte)1, 4, 7, 10, 13, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80);
+    private static readonly Vector128<byte> GreenFromSecond = Vector128.Create((byte)0x80, 0x80, 0x80, 0x80, 0x80, 0, 3, 6, 9, 12, 15, 0x80, 0x80, 0x80, 0x80, 0x80);
+    private static readonly Vector128<byte> GreenFromThird = Vector128.Create((byte)0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 2, 5, 8, 11, 14);
+    private static readonly Vector128<byte> BlueFromFirst = Vector128.Create((byte)2, 5, 8, 11, 14, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80);
+    private static readonly Vector128<byte> BlueFromSecond = Vector128.Create((byte)0x80, 0x80, 0x80, 0x80, 0x80, 1, 4, 7, 10, 13, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80);
+    private static readonly Vector128<byte> BlueFromThird = Vector128.Create((byte)0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0, 3, 6, 9, 12, 15);
+
     /// <summary>
     /// Calculate Euclidean distance between two 2D points using SIMD when available.
     /// </summary>
@@ -79,6 +93,130 @@ public static class SimdMath
         }
     }
 
+    /// <summary>
+    /// IoU of one box against many, all given as corners (x1, y1, x2, y2) plus precomputed areas in
+    /// structure-of-arrays form, processing several boxes per instruction when SIMD is available.
+    /// </summary>
+    public static void CalculateIoUs(float x1, float y1, float x2, float y2, float area,
+        ReadOnlySpan<float> x1s, ReadOnlySpan<float> y1s, ReadOnlySpan<float> x2s, ReadOnlySpan<float> y2s,
+        ReadOnlySpan<float> areas, Span<float> results)
+    {
+        if (x1s.Length != y1s.Length || x1s.Length != x2s.Length || x1s.Length != y2s.Length ||
+            x1s.Length != areas.Length || x1s.Length != results.Length)
+        {
+            throw new ArgumentException("All input spans must have the same length");
+        }
+
+        var box = new CornerBox(x1, y1, x2, y2, area);
+        var others = new CornerBoxes(x1s, y1s, x2s, y2s, areas);
+        if (Vector256.IsHardwareAccelerated && x1s.Length >= Vector256<float>.Count)
+        {
+            CalculateIoUsAVX(box, others, results);
+        }
+        else if (Vector128.IsHardwareAccelerated && x1s.Length >= Vector128<float>.Count)
+        {
+            CalculateIoUsSSE(box, others, results);
+        }
+        else
+        {
+            CalculateIoUsScalar(box, others, results, 0);
+        }
+    }
+
+    /// <summary>
+    /// For each column of a row-major [rowCount x columnCount] matrix, find the largest value and the
+    /// row it is in (the first such row on ties), processing several columns per instruction when SIMD is available.
+    /// </summary>
+    public static void ArgMaxColumns(ReadOnlySpan<float> matrix, int rowCount, int columnCount,
+        Span<float> maxValues, Span<int> maxIndices)
+    {
+        if (rowCount < 1 || matrix.Length < rowCount * columnCount || maxValues.Length < columnCount || maxIndices.Length < columnCount)
+        {
+            throw new ArgumentException("Matrix must hold rowCount x columnCount values and outputs at least columnCount values");
+        }
+
+        // Row 0 seeds the running maxima; later rows only replace them when strictly greater
+        matrix.Slice(0, columnCount).CopyTo(maxValues);
+        maxIndices.Slice(0, columnCount).Clear();
+
+        for (int row = 1; row < rowCount; row++)
+        {
+            var values = matrix.Slice(row * columnCount, columnCount);
+
+            if (Vector256.IsHardwareAccelerated && columnCount >= Vector256<float>.Count)
+            {
+                ArgMaxRowAVX(values, row, maxValues, maxIndices);
+            }
+            else if (Vector128.IsHardwareAccelerated && columnCount >= Vector128<float>.Count)
+            {
+                ArgMaxRowSSE(values, row, maxValues, maxIndices);
+            }
+            else
+            {
+                ArgMaxRowScalar(values, row, maxValues, maxIndices, 0);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Write the indices of all values at or above <paramref name="threshold"/> to <paramref name="indices"/>,
+    /// in ascending order, using SIMD when available. Returns the number of indices written.
+    /// </summary>
+    public static int IndicesAtOrAbove(ReadOnlySpan<float> values, float threshold, Span<int> indices)
+    {
+        if (indices.Length < values.Length)
+        {
+            throw new ArgumentException("Indices must have room for every value");
+        }
+
+        if (Vector256.IsHardwareAccelerated && values.Length >= Vector256<float>.Count)
+        {
+            return IndicesAtOrAboveAVX(values, threshold, indices);
+        }
+        else if (Vector128.IsHardwareAccelerated && values.Length >= Vector128<float>.Count)
+        {
+            return IndicesAtOrAboveSSE(values, threshold, indices);
+        }
+        else
+        {
+            return IndicesAtOrAboveScalar(values, threshold, indices, 0, 0);
+        }
+    }
+
+    /// <summary>
+    /// Split interleaved RGB bytes into separate red, green and blue planes of values in [0, 1],
+    /// widening and scaling 16 pixels per step when SIMD is available.
+    /// </summary>
+    public static void NormalizeRgbToPlanes(ReadOnlySpan<byte> rgb, Span<float> red, Span<float> green, Span<float> blue)
+    {
+        var pixelCount = rgb.Length / 3;
+        if (rgb.Length % 3 != 0 || red.Length < pixelCount || green.Length < pixelCount || blue.Length < pixelCount)
+        {
+            throw new ArgumentException("Input must hold whole RGB pixels and each plane one value per pixel");
+        }
+
+        if (Ssse3.IsSupported && pixelCount >= 16)
+        {
+            NormalizeRgbToPlanesSSE(rgb, red, green, blue);
+        }
+        else
+        {
+            NormalizeRgbToPlanesScalar(rgb, red, green, blue, 0);
+        }
+    }
+
+    private readonly record struct CornerBox(float X1, float Y1, float X2, float Y2, float Area);
+
+    private readonly ref struct CornerBoxes(ReadOnlySpan<float> x1, ReadOnlySpan<float> y1,
+        ReadOnlySpan<float> x2, ReadOnlySpan<float> y2, ReadOnlySpan<float> areas)
+    {
+        public readonly ReadOnlySpan<float> X1 = x1;
+        public readonly ReadOnlySpan<float> Y1 = y1;
+        public readonly ReadOnlySpan<float> X2 = x2;
+        public readonly ReadOnlySpan<float> Y2 = y2;
+        public readonly ReadOnlySpan<float> Areas = areas;
+    }
+
     #region SSE Implementations
 
     private static float CalculateDistanceSSE(float x1, float y1, float x2, float y2)
@@ -179,6 +317,115 @@ public static class SimdMath
         }
     }
 
+    private static void ArgMaxRowSSE(ReadOnlySpan<float> values, int row, Span<float> maxValues, Span<int> maxIndices)
+    {
+        int i = 0;
+        int vectorSize = Vector128<float>.Count;
+        var rowIndex = Vector128.Create(row);
+
+        // Process 4 columns at a time
+        for (; i <= values.Length - vectorSize; i += vectorSize)
+        {
+            var v = Vector128.Create(values.Slice(i, vectorSize));
+            var max = Vector128.Create((ReadOnlySpan<float>)maxValues.Slice(i, vectorSize));
+            var index = Vector128.Create((ReadOnlySpan<int>)maxIndices.Slice(i, vectorSize));
+
+            var greater = Vector128.GreaterThan(v, max);
+            Vector128.ConditionalSelect(greater, v, max).CopyTo(maxValues.Slice(i));
+            Vector128.ConditionalSelect(greater.AsInt32(), rowIndex, index).CopyTo(maxIndices.Slice(i));
+        }
+
+        ArgMaxRowScalar(values, row, maxValues, maxIndices, i);
+    }
+
+    private static void CalculateIoUsSSE(CornerBox box, CornerBoxes others, Span<float> results)
+    {
+        int i = 0;
+        int vectorSize = Vector128<float>.Count;
+        var zero = Vector128<float>.Zero;
+        var bx1 = Vector128.Create(box.X1);
+        var by1 = Vector128.Create(box.Y1);
+        var bx2 = Vector128.Create(box.X2);
+        var by2 = Vector128.Create(box.Y2);
+        var barea = Vector128.Create(box.Area);
+
+        // Process 4 boxes at a time; max/min replace the per-box branches
+        for (; i <= results.Length - vectorSize; i += vectorSize)
+        {
+            var width = Vector128.Max(zero, Vector128.Min(bx2, Vector128.Create(others.X2.Slice(i, vectorSize)))
+                - Vector128.Max(bx1, Vector128.Create(others.X1.Slice(i, vectorSize))));
+            var height = Vector128.Max(zero, Vector128.Min(by2, Vector128.Create(others.Y2.Slice(i, vectorSize)))
+                - Vector128.Max(by1, Vector128.Create(others.Y1.Slice(i, vectorSize))));
+            var intersection = width * height;
+            var union = barea + Vector128.Create(others.Areas.Slice(i, vectorSize)) - intersection;
+
+            Vector128.ConditionalSelect(Vector128.GreaterThan(union, zero), intersection / union, zero).CopyTo(results.Slice(i));
+        }
+
+        // Process remaining boxes with scalar
+        CalculateIoUsScalar(box, others, results, i);
+    }
+
+    private static void NormalizeRgbToPlanesSSE(ReadOnlySpan<byte> rgb, Span<float> red, Span<float> green, Span<float> blue)
+    {
+        int i = 0;
+        var pixelCount = rgb.Length / 3;
+        var scale = Vector128.Create(ByteToUnit);
+
+        // Process 16 pixels (48 bytes) at a time
+        for (; i <= pixelCount - 16; i += 16)
+        {
+            var first = Vector128.Create(rgb.Slice(i * 3, 16));
+            var second = Vector128.Create(rgb.Slice(i * 3 + 16, 16));
+            var third = Vector128.Create(rgb.Slice(i * 3 + 32, 16));
+
+            WriteUnitFloats(Ssse3.Shuffle(first, RedFromFirst) | Ssse3.Shuffle(second, RedFromSecond) | Ssse3.Shuffle(third, RedFromThird),
+                red.Slice(i), scale);
+            WriteUnitFloats(Ssse3.Shuffle(first, GreenFromFirst) | Ssse3.Shuffle(second, GreenFromSecond) | Ssse3.Shuffle(third, GreenFromThird),
+                green.Slice(i), scale);
+            WriteUnitFloats(Ssse3.Shuffle(first, BlueFromFirst) | Ssse3.Shuffle(second, BlueFromSecond) | Ssse3.Shuffle(third, BlueFromThird),
+                blue.Slice(i), scale);
+        }
+
+        // Process remaining pixels with scalar
+        NormalizeRgbToPlanesScalar(rgb, red, green, blue, i);
+    }
+
+    private static void WriteUnitFloats(Vector128<byte> values, Span<float> destination, Vector128<float> scale)
+    {
+        // Widen bytes to 32-bit lanes (exact, since they are at most 255) and scale with one multiply
+        var (lower, upper) = Vector128.Widen(values);
+        var (first, second) = Vector128.Widen(lower);
+        var (third, fourth) = Vector128.Widen(upper);
+
+        (Vector128.ConvertToSingle(first.AsInt32()) * scale).CopyTo(destination);
+        (Vector128.ConvertToSingle(second.AsInt32()) * scale).CopyTo(destination.Slice(4));
+        (Vector128.ConvertToSingle(third.AsInt32()) * scale).CopyTo(destination.Slice(8));
+        (Vector128.ConvertToSingle(fourth.AsInt32()) * scale).CopyTo(destination.Slice(12));
+    }
+
+    private static int IndicesAtOrAboveSSE(ReadOnlySpan<float> values, float threshold, Span<int> indices)
+    {
+        int i = 0;
+        int count = 0;
+        int vectorSize = Vector128<float>.Count;
+        var limit = Vector128.Create(threshold);
+
+        // Compare 4 values at a time; most blocks have no hits and are skipped by a single mask test
+        for (; i <= values.Length - vectorSize; i += vectorSize)
+        {
+            var mask = Vector128.GreaterThanOrEqual(Vector128.Create(values.Slice(i, vectorSize)), limit).ExtractMostSignificantBits();
+            while (mask != 0)
+            {
+                indices[count++] = i + BitOperations.TrailingZeroCount(mask);
+                mask &= mask - 1;
+            }
+        }
+
+        // Process remaining values with scalar
+        return IndicesAtOrAboveScalar(values, threshold, indices, i, count);
+    }
+
     #endregion
 
     #region AVX Implementations
@@ -219,6 +466,78 @@ public static class SimdMath
         }
     }
 
+    private static void ArgMaxRowAVX(ReadOnlySpan<float> values, int row, Span<float> maxValues, Span<int> maxIndices)
+    {
+        int i = 0;
+        int vectorSize = Vector256<float>.Count;
+        var rowIndex = Vector256.Create(row);
+
+        // Process 8 columns at a time
+        for (; i <= values.Length - vectorSize; i += vectorSize)
+        {
+            var v = Vector256.Create(values.Slice(i, vectorSize));
+            var max = Vector256.Create((ReadOnlySpan<float>)maxValues.Slice(i, vectorSize));
+            var index = Vector256.Create((ReadOnlySpan<int>)maxIndices.Slice(i, vectorSize));
+
+            var greater = Vector256.GreaterThan(v, max);
+            Vector256.ConditionalSelect(greater, v, max).CopyTo(maxValues.Slice(i));
+            Vector256.ConditionalSelect(greater.AsInt32(), rowIndex, index).CopyTo(maxIndices.Slice(i));
+        }
+
+        // Process remaining columns with scalar
+        ArgMaxRowScalar(values, row, maxValues, maxIndices, i);
+    }
+
+    private static void CalculateIoUsAVX(CornerBox box, CornerBoxes others, Span<float> results)
+    {
+        int i = 0;
+        int vectorSize = Vector256<float>.Count;
+        var zero = Vector256<float>.Zero;
+        var bx1 = Vector256.Create(box.X1);
+        var by1 = Vector256.Create(box.Y1);
+        var bx2 = Vector256.Create(box.X2);
+        var by2 = Vector256.Create(box.Y2);
+        var barea = Vector256.Create(box.Area);
+
+        // Process 8 boxes at a time; max/min replace the per-box branches
+        for (; i <= results.Length - vectorSize; i += vectorSize)
+        {
+            var width = Vector256.Max(zero, Vector256.Min(bx2, Vector256.Create(others.X2.Slice(i, vectorSize)))
+                - Vector256.Max(bx1, Vector256.Create(others.X1.Slice(i, vectorSize))));
+            var height = Vector256.Max(zero, Vector256.Min(by2, Vector256.Create(others.Y2.Slice(i, vectorSize)))
+                - Vector256.Max(by1, Vector256.Create(others.Y1.Slice(i, vectorSize))));
+            var intersection = width * height;
+            var union = barea + Vector256.Create(others.Areas.Slice(i, vectorSize)) - intersection;
+
+            Vector256.ConditionalSelect(Vector256.GreaterThan(union, zero), intersection / union, zero).CopyTo(results.Slice(i));
+        }
+
+        // Process remaining boxes with scalar
+        CalculateIoUsScalar(box, others, results, i);
+    }
+
+    private static int IndicesAtOrAboveAVX(ReadOnlySpan<float> values, float threshold, Span<int> indices)
+    {
+        int i = 0;
+        int count = 0;
+        int vectorSize = Vector256<float>.Count;
+        var limit = Vector256.Create(threshold);
+
+        // Compare 8 values at a time; most blocks have no hits and are skipped by a single mask test
+        for (; i <= values.Length - vectorSize; i += vectorSize)
+        {
+            var mask = Vector256.GreaterThanOrEqual(Vector256.Create(values.Slice(i, vectorSize)), limit).ExtractMostSignificantBits();
+            while (mask != 0)
+            {
+                indices[count++] = i + BitOperations.TrailingZeroCount(mask);
+                mask &= mask - 1;
+            }
+        }
+
+        // Process remaining values with scalar
+        return IndicesAtOrAboveScalar(values, threshold, indices, i, count);
+    }
+
     #endregion
 
     #region Scalar Fallback Implementations
@@ -269,6 +588,54 @@ public static class SimdMath
         return union > 0 ? intersection / union : 0f;
     }
 
+    private static void ArgMaxRowScalar(ReadOnlySpan<float> values, int row, Span<float> maxValues, Span<int> maxIndices, int start)
+    {
+        for (int i = start; i < values.Length; i++)
+        {
+            if (values[i] > maxValues[i])
+            {
+                maxValues[i] = values[i];
+                maxIndices[i] = row;
+            }
+        }
+    }
+
+    private static void CalculateIoUsScalar(CornerBox box, CornerBoxes others, Span<float> results, int start)
+    {
+        for (int i = start; i < results.Length; i++)
+        {
+            var width = Math.Max(0f, Math.Min(box.X2, others.X2[i]) - Math.Max(box.X1, others.X1[i]));
+            var height = Math.Max(0f, Math.Min(box.Y2, others.Y2[i]) - Math.Max(box.Y1, others.Y1[i]));
+            var intersection = width * height;
+            var union = box.Area + others.Areas[i] - intersection;
+            results[i] = union > 0 ? intersection / union : 0;
+        }
+    }
+
+    private static void NormalizeRgbToPlanesScalar(ReadOnlySpan<byte> rgb, Span<float> red, Span<float> green, Span<float> blue, int start)
+    {
+        var pixelCount = rgb.Length / 3;
+        for (int i = start; i < pixelCount; i++)
+        {
+            red[i] = rgb[i * 3] * ByteToUnit;
+            green[i] = rgb[i * 3 + 1] * ByteToUnit;
+            blue[i] = rgb[i * 3 + 2] * ByteToUnit;
+        }
+    }
+
+    private static int IndicesAtOrAboveScalar(ReadOnlySpan<float> values, float threshold, Span<int> indices, int start, int count)
+    {
+        for (int i = start; i < values.Length; i++)
+        {
+            if (values[i] >= threshold)
+            {
+                indices[count++] = i;
+            }
+        }
+
+        return count;
+    }
+
     private static void CalculateDistancesScalar(ReadOnlySpan<float> x1, ReadOnlySpan<float> y1,
         ReadOnlySpan<float> x2, ReadOnlySpan<float> y2, Span<float> results)
     {
@@ -0,0 +1,91 @@
+using System.Runtime.InteropServices;
+using Microsoft.ML.OnnxRuntime.Tensors;
+using SixLabors.ImageSharp;
+using SixLabors.ImageSharp.PixelFormats;
+using SixLabors.ImageSharp.Processing;
+
+namespace ADCommsPersonTracking.Api.Helpers;
+
+/// <summary>
+/// Turns encoded images into the normalized NCHW float tensors YOLO models take as input.
+/// </summary>
+public static class YoloPreprocessor
+{
+    /// <summary>
+    /// Decode, resize to the model input size and write the pixels as a [1, 3, height, width] tensor
+    /// with channel values scaled to [0, 1]. Also returns the original image size.
+    /// </summary>
+    public static (DenseTensor<float> Tensor, int OriginalWidth, int OriginalHeight) CreateInputTensor(
+        byte[] imageBytes, int inputWidth, int inputHeight)
+    {
+        return CreateInputTensor(imageBytes, inputWidth, inputHeight, new float[GetInputLength(inputWidth, inputHeight)]);
+    }
+
+    /// <summary>
+    /// Same as above, but writes into a caller-owned <paramref name="buffer"/> (e.g. rented from
+    /// <see cref="System.Buffers.ArrayPool{T}"/>) instead of allocating one. The returned tensor
+    /// views the buffer, so it is only valid until the buffer is reused.
+    /// </summary>
+    public static (DenseTensor<float> Tensor, int OriginalWidth, int OriginalHeight) CreateInputTensor(
+        byte[] imageBytes, int inputWidth, int inputHeight, float[] buffer)
+    {
+        var length = GetInputLength(inputWidth, inputHeight);
+        if (buffer.Length < length)
+        {
+            throw new ArgumentException("Buffer is too small for the model input", nameof(buffer));
+        }
+
+        using var image = Image.Load<Rgb24>(imageBytes);
+        var originalWidth = image.Width;
+        var originalHeight = image.Height;
+
+        // Resize image to model input size
+        image.Mutate(x => x.Resize(inputWidth, inputHeight));
+
+        // Rented buffers can be longer than requested, so the tensor views exactly one input
+        var memory = buffer.AsMemory(0, length);
+        WritePlanarRgb(image, memory);
+
+        var tensor = new DenseTensor<float>(memory, new[] { 1, 3, inputHeight, inputWidth });
+        return (tensor, originalWidth, originalHeight);
+    }
+
+    /// <summary>
+    /// Number of floats in a [1, 3, height, width] input tensor.
+    /// </summary>
+    public static int GetInputLength(int inputWidth, int inputHeight) => 3 * inputWidth * inputHeight;
+
+    /// <summary>
+    /// Write the image as three consecutive R, G and B planes of values in [0, 1].
+    /// <paramref name="destination"/> must hold at least 3 * width * height floats.
+    /// </summary>
+    public static void WritePlanarRgb(Image<Rgb24> image, Memory<float> destination)
+    {
+        var width = image.Width;
+        var height = image.Height;
+        var planeSize = width * height;
+
+        if (destination.Length < 3 * planeSize)
+        {
+            throw new ArgumentException("Destination is too small for the image planes", nameof(destination));
+        }
+
+        // Walk each pixel row once and scatter it into the three planes, instead of going
+        // through the per-pixel image and tensor indexers. The resize stays in bytes; each row is
+        // widened and normalized straight into the float planes without a float image in between
+        image.ProcessPixelRows(accessor =>
+        {
+            var planes = destination.Span;
+            var red = planes.Slice(0, planeSize);
+            var green = planes.Slice(planeSize, planeSize);
+            var blue = planes.Slice(2 * planeSize, planeSize);
+
+            for (int y = 0; y < height; y++)
+            {
+                var row = MemoryMarshal.AsBytes(accessor.GetRowSpan(y));
+                var offset = y * width;
+                SimdMath.NormalizeRgbToPlanes(row, red.Slice(offset, width), green.Slice(offset, width), blue.Slice(offset, width));
+            }
+        });
+    }
+}
@@ -411,4 +411,77 @@ public static partial class LogMessages
         this ILogger logger,
         float confidence,
         float threshold);
+
+    // OnnxSessionFactory
+    [LoggerMessage(
+        EventId = 48,
+        Level = LogLevel.Information,
+        Message = "Enabled ONNX Runtime execution provider {Provider} for {ModelPath}")]
+    public static partial void LogExecutionProviderEnabled(
+        this ILogger logger,
+        string provider,
+        string modelPath);
+
+    [LoggerMessage(
+        EventId = 49,
+        Level = LogLevel.Warning,
+        Message = "ONNX Runtime execution provider {Provider} is not available for {ModelPath}, falling back: {Reason}")]
+    public static partial void LogExecutionProviderUnavailable(
+        this ILogger logger,
+        string provider,
+        string modelPath,
+        string reason);
+
+    [LoggerMessage(
+        EventId = 50,
+        Level = LogLevel.Warning,
+        Message = "Ignoring invalid session hints file {HintsPath}: {Reason}")]
+    public static partial void LogSessionHintsInvalid(
+        this ILogger logger,
+        string hintsPath,
+        string reason);
+
+    [LoggerMessage(
+        EventId = 51,
+        Level = LogLevel.Information,
+        Message = "Loaded pre-optimized ORT-format model from {OrtModelPath}")]
+    public static partial void LogOrtFormatModelLoaded(
+        this ILogger logger,
+        string ortModelPath);
+
+    [LoggerMessage(
+        EventId = 52,
+        Level = LogLevel.Warning,
+        Message = "Could not load ORT-format model {OrtModelPath}, loading the ONNX model instead: {Reason}")]
+    public static partial void LogOrtFormatModelLoadFailed(
+        this ILogger logger,
+        string ortModelPath,
+        string reason);
+
+    [LoggerMessage(
+        EventId = 53,
+        Level = LogLevel.Information,
+        Message = "Model takes batches of {BatchSize} images; batching requests with a {BatchTimeoutMs} ms window")]
+    public static partial void LogInferenceBatchingEnabled(
+        this ILogger logger,
+        int batchSize,
+        double batchTimeoutMs);
+
+    [LoggerMessage(
+        EventId = 54,
+        Level = LogLevel.Information,
+        Message = "Warmup inference for {ModelPath} took {ElapsedMs} ms")]
+    public static partial void LogModelWarmedUp(
+        this ILogger logger,
+        string modelPath,
+        double elapsedMs);
+
+    [LoggerMessage(
+        EventId = 55,
+        Level = LogLevel.Warning,
+        Message = "Warmup inference for {ModelPath} failed; the first request will pay the startup cost")]
+    public static partial void LogModelWarmupFailed(
+        this ILogger logger,
+        string modelPath,
+        Exception ex);
 }
@@ -0,0 +1,25 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace ADCommsPersonTracking.Api.Models;
+
+/// <summary>
+/// Compile-time generated JSON metadata and serializers for the API's request and response models.
+/// Options match ASP.NET Core's web defaults, so responses use the generated fast path instead of
+/// reflection; types not listed here (e.g. anonymous responses) still fall back to reflection.
+/// </summary>
+[JsonSourceGenerationOptions(JsonSerializerDefaults.Web)]
+[JsonSerializable(typeof(TrackingRequest))]
+[JsonSerializable(typeof(TrackingResponse))]
+[JsonSerializable(typeof(PersonTrack))]
+[JsonSerializable(typeof(List<PersonTrack>))]
+[JsonSerializable(typeof(VideoUploadJob))]
+[JsonSerializable(typeof(VideoUploadJobResponse))]
+[JsonSerializable(typeof(TrackByIdRequest))]
+[JsonSerializable(typeof(TrackByIdJob))]
+[JsonSerializable(typeof(TrackByIdJobResponse))]
+[JsonSerializable(typeof(InferenceDiagnostics))]
+[JsonSerializable(typeof(List<string>))]
+internal partial class ApiJsonContext : JsonSerializerContext
+{
+}
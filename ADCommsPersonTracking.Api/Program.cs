@@ -1,3 +1,4 @@
+using ADCommsPersonTracking.Api.Models;
 using ADCommsPersonTracking.Api.Services;
 using System.Diagnostics;
 
@@ -10,7 +11,12 @@ builder.AddServiceDefaults();
 await WaitForModelFileAsync(builder.Configuration, builder);
 
 // Add services to the container
-builder.Services.AddControllers();
+builder.Services.AddControllers()
+    .AddJsonOptions(options =>
+    {
+        // Source-generated serializers for the API models; other types keep the reflection-based resolver
+        options.JsonSerializerOptions.TypeInfoResolverChain.Insert(0, ApiJsonContext.Default);
+    });
 builder.Services.AddEndpointsApiExplorer();
 builder.Services.AddOpenApi();
 
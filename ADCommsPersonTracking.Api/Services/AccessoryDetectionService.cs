@@ -1,3 +1,4 @@
+using ADCommsPersonTracking.Api.Helpers;
 using ADCommsPersonTracking.Api.Logging;
 using ADCommsPersonTracking.Api.Models;
 using Microsoft.ML.OnnxRuntime;
@@ -75,7 +76,7 @@ public class AccessoryDetectionService : IAccessoryDetectionService, IDisposable
         {
             try
             {
-                _session = new InferenceSession(modelPath);
+                _session = OnnxSessionFactory.Create(modelPath, configuration, _logger);
                 _logger.LogInformation("Accessory detection model loaded from {ModelPath}", modelPath);
             }
             catch (Exception ex)
@@ -1,10 +1,9 @@
+using System.Buffers;
+using ADCommsPersonTracking.Api.Helpers;
 using ADCommsPersonTracking.Api.Logging;
 using ADCommsPersonTracking.Api.Models;
 using Microsoft.ML.OnnxRuntime;
 using Microsoft.ML.OnnxRuntime.Tensors;
-using SixLabors.ImageSharp;
-using SixLabors.ImageSharp.PixelFormats;
-using SixLabors.ImageSharp.Processing;
 
 namespace ADCommsPersonTracking.Api.Services;
 
@@ -17,6 +16,8 @@ public class ClothingDetectionService : IClothingDetectionService, IDisposable
     private readonly ILogger<ClothingDetectionService> _logger;
     private readonly IConfiguration _configuration;
     private InferenceSession? _session;
+    private string _inputName = string.Empty;
+    private string[] _outputNames = Array.Empty<string>();
     private readonly string? _modelPath;
     private bool _enabled;  // Not readonly because it can be disabled if model loading fails
     private readonly float _confidenceThreshold;
@@ -113,7 +114,12 @@ public class ClothingDetectionService : IClothingDetectionService, IDisposable
         {
             try
             {
-                _session = new InferenceSession(_modelPath);
+                _session = OnnxSessionFactory.Create(_modelPath, configuration, _logger);
+
+                // Look the graph's input and output names up once instead of on every run
+                _inputName = _session.InputMetadata.Keys.First();
+                _outputNames = new[] { _session.OutputMetadata.Keys.First() };
+
                 _logger.LogInformation("Clothing detection model loaded from {ModelPath}", _modelPath);
             }
             catch (Exception ex)
@@ -146,35 +152,20 @@ public class ClothingDetectionService : IClothingDetectionService, IDisposable
 
         var threshold = confidenceThreshold ?? _confidenceThreshold;
 
+        // Pooled input buffer, so each request does not allocate a fresh 4.9 MB tensor
+        var inputBuffer = ArrayPool<float>.Shared.Rent(YoloPreprocessor.GetInputLength(InputWidth, InputHeight));
         try
         {
-            using var image = Image.Load<Rgb24>(imageBytes);
-            var originalWidth = image.Width;
-            var originalHeight = image.Height;
-
-            // Resize image to model input size
-            image.Mutate(x => x.Resize(InputWidth, InputHeight));
-
-            // Prepare input tensor in NCHW format (batch, channels, height, width)
-            var input = new DenseTensor<float>(new[] { 1, 3, InputHeight, InputWidth });
-            for (int y = 0; y < InputHeight; y++)
-            {
-                for (int x = 0; x < InputWidth; x++)
-                {
-                    var pixel = image[x, y];
-                    input[0, 0, y, x] = pixel.R / 255f;
-                    input[0, 1, y, x] = pixel.G / 255f;
-                    input[0, 2, y, x] = pixel.B / 255f;
-                }
-            }
+            // Decode, resize and normalize into an NCHW tensor (batch, channels, height, width)
+            var (input, originalWidth, originalHeight) = YoloPreprocessor.CreateInputTensor(imageBytes, InputWidth, InputHeight, inputBuffer);
 
             // Run inference
             var inputs = new List<NamedOnnxValue>
             {
-                NamedOnnxValue.CreateFromTensor("images", input)
+                NamedOnnxValue.CreateFromTensor(_inputName, input)
             };
 
-            using var results = _session.Run(inputs);
+            using var results = _session.Run(inputs, _outputNames);
             var output = results.First().AsTensor<float>();
 
             // Parse YOLO output and extract clothing items with bounding boxes
@@ -188,6 +179,10 @@ public class ClothingDetectionService : IClothingDetectionService, IDisposable
             _logger.LogError(ex, "Error detecting clothing items");
             return new List<DetectedClothingItem>();
         }
+        finally
+        {
+            ArrayPool<float>.Shared.Return(inputBuffer);
+        }
     }
 
     private List<DetectedClothingItem> ParseYoloOutput(Tensor<float> output, float confidenceThreshold, int originalWidth, int originalHeight)
@@ -0,0 +1,166 @@
+using System.Threading.Channels;
+using Microsoft.ML.OnnxRuntime.Tensors;
+
+namespace ADCommsPersonTracking.Api.Services;
+
+/// <summary>
+/// Groups single-image inference requests into one run of a model exported with a fixed batch size.
+/// The first queued request waits at most the configured time for others to fill the batch;
+/// unfilled slots are zero-padded.
+/// </summary>
+public sealed class InferenceBatcher : IDisposable
+{
+    private readonly Channel<BatchItem> _requests = Channel.CreateUnbounded<BatchItem>(new UnboundedChannelOptions
+    {
+        SingleReader = true
+    });
+    private readonly int[] _batchDimensions;
+    private readonly int _batchSize;
+    private readonly int _itemLength;
+    private readonly float[] _batchBuffer;
+    private readonly TimeSpan _maxWait;
+    private readonly Func<DenseTensor<float>, DenseTensor<float>> _runBatch;
+    private readonly Task _processing;
+
+    /// <summary>
+    /// <paramref name="batchDimensions"/> is the model's full input shape, e.g. [4, 3, 640, 640].
+    /// <paramref name="runBatch"/> runs the model on one batch and returns its output in a buffer it
+    /// no longer uses; the batch dimension must be the output's first dimension.
+    /// </summary>
+    public InferenceBatcher(int[] batchDimensions, TimeSpan maxWait, Func<DenseTensor<float>, DenseTensor<float>> runBatch)
+    {
+        if (batchDimensions.Length < 2 || batchDimensions.Any(d => d < 1))
+        {
+            throw new ArgumentException("Batch dimensions must be fixed and include the batch size", nameof(batchDimensions));
+        }
+
+        _batchDimensions = batchDimensions;
+        _batchSize = batchDimensions[0];
+        _itemLength = batchDimensions.Skip(1).Aggregate(1, (length, d) => length * d);
+        _batchBuffer = new float[_batchSize * _itemLength];
+        _maxWait = maxWait;
+        _runBatch = runBatch;
+        _processing = Task.Run(ProcessAsync);
+    }
+
+    /// <summary>
+    /// Number of images per model run.
+    /// </summary>
+    public int BatchSize => _batchSize;
+
+    /// <summary>
+    /// Queue one image's input (one batch slot's worth of values) and return that image's output,
+    /// shaped like the model output with a batch dimension of 1.
+    /// </summary>
+    public Task<DenseTensor<float>> RunAsync(ReadOnlyMemory<float> input)
+    {
+        if (input.Length != _itemLength)
+        {
+            throw new ArgumentException($"Input must hold exactly {_itemLength} values", nameof(input));
+        }
+
+        // Continuations run off the batching loop, so callers' parsing doesn't delay the next batch
+        var item = new BatchItem(input, new TaskCompletionSource<DenseTensor<float>>(TaskCreationOptions.RunContinuationsAsynchronously));
+        if (!_requests.Writer.TryWrite(item))
+        {
+            throw new ObjectDisposedException(nameof(InferenceBatcher));
+        }
+
+        return item.Completion.Task;
+    }
+
+    private async Task ProcessAsync()
+    {
+        var reader = _requests.Reader;
+        var pending = new List<BatchItem>(_batchSize);
+
+        try
+        {
+            while (await reader.WaitToReadAsync())
+            {
+                pending.Clear();
+
+                // A request is waiting; give others a short window to join its batch
+                using var window = new CancellationTokenSource(_maxWait);
+                try
+                {
+                    while (pending.Count < _batchSize)
+                    {
+                        if (reader.TryRead(out var item))
+                        {
+                            pending.Add(item);
+                        }
+                        else if (!await reader.WaitToReadAsync(window.Token))
+                        {
+                            break;
+                        }
+                    }
+                }
+                catch (OperationCanceledException)
+                {
+                    // Window elapsed; run what has been collected
+                }
+
+                if (pending.Count > 0)
+                {
+                    RunBatch(pending);
+                }
+            }
+        }
+        catch (Exception ex)
+        {
+            // The loop cannot continue; stop accepting requests and fail every waiting one
+            // instead of leaving its caller hanging
+            _requests.Writer.TryComplete(ex);
+            foreach (var item in pending)
+            {
+                item.Completion.TrySetException(ex);
+            }
+            while (reader.TryRead(out var item))
+            {
+                item.Completion.TrySetException(ex);
+            }
+        }
+    }
+
+    private void RunBatch(List<BatchItem> pending)
+    {
+        try
+        {
+            for (int k = 0; k < pending.Count; k++)
+            {
+                pending[k].Input.Span.CopyTo(_batchBuffer.AsSpan(k * _itemLength, _itemLength));
+            }
+            _batchBuffer.AsSpan(pending.Count * _itemLength).Clear();
+
+            var output = _runBatch(new DenseTensor<float>(_batchBuffer, _batchDimensions));
+
+            // Each image gets a view of its own slice of the batch output
+            var outputItemLength = (int)(output.Length / _batchSize);
+            var outputItemDimensions = output.Dimensions.ToArray();
+            outputItemDimensions[0] = 1;
+            for (int k = 0; k < pending.Count; k++)
+            {
+                var slice = output.Buffer.Slice(k * outputItemLength, outputItemLength);
+                pending[k].Completion.TrySetResult(new DenseTensor<float>(slice, outputItemDimensions));
+            }
+        }
+        catch (Exception ex)
+        {
+            foreach (var item in pending)
+            {
+                item.Completion.TrySetException(ex);
+            }
+        }
+    }
+
+    public void Dispose()
+    {
+        // Lets the loop drain what is already queued, then waits for it to exit; the loop
+        // handles its own failures, so this does not throw
+        _requests.Writer.TryComplete();
+        _processing.GetAwaiter().GetResult();
+    }
+
+    private sealed record BatchItem(ReadOnlyMemory<float> Input, TaskCompletionSource<DenseTensor<float>> Completion);
+}
@@ -1,10 +1,10 @@
+using System.Buffers;
+using System.Diagnostics;
+using ADCommsPersonTracking.Api.Helpers;
 using ADCommsPersonTracking.Api.Logging;
 using ADCommsPersonTracking.Api.Models;
 using Microsoft.ML.OnnxRuntime;
 using Microsoft.ML.OnnxRuntime.Tensors;
-using SixLabors.ImageSharp;
-using SixLabors.ImageSharp.PixelFormats;
-using SixLabors.ImageSharp.Processing;
 
 namespace ADCommsPersonTracking.Api.Services;
 
@@ -12,14 +12,25 @@ public class ObjectDetectionService : IObjectDetectionService, IDisposable
 {
     private readonly ILogger<ObjectDetectionService> _logger;
     private InferenceSession? _session;
+    private string _inputName = string.Empty;
+    private string[] _outputNames = Array.Empty<string>();
+    private bool _halfInput; // FP16 models converted without keeping FP32 inputs/outputs
+    private bool _halfOutput;
+    private int[]? _outputDimensions; // Set when the output shape is fixed, so outputs can be bound to pooled buffers
+    private long[] _outputShape = Array.Empty<long>();
+    private int _outputLength;
     private readonly string _modelPath;
     private const int InputWidth = 640;
     private const int InputHeight = 640;
     private const float ConfidenceThreshold = 0.45f;
     private readonly float _accessoryConfidenceThreshold;
+    private readonly SemaphoreSlim? _inferenceGate;
+    private readonly InferenceBatcher? _batcher;
     private const float IouThreshold = 0.5f;
     private const int MaxDetections = 8400; // YOLO11 output detections
     private const int NumCocoClasses = 80; // Number of classes in COCO dataset
+    private const int EndToEndRowLength = 6; // x1, y1, x2, y2, score, class per row of models exported with --nms
+    private static readonly long[] InputShape = { 1, 3, InputHeight, InputWidth };
     
     // COCO class IDs for accessories
     private static readonly HashSet<int> AccessoryClassIds = new() { 24, 26, 27, 28 }; // backpack, handbag, tie, suitcase
@@ -39,19 +50,67 @@ public class ObjectDetectionService : IObjectDetectionService, IDisposable
         
         // Read accessory confidence threshold from configuration, default to 0.25
         _accessoryConfidenceThreshold = configuration.GetValue<float>("ObjectDetection:AccessoryConfidenceThreshold", 0.25f);
+
+        // Bound concurrent inferences across all requests so parallel frames don't oversubscribe
+        // ONNX Runtime's intra-op threads; 0 means unbounded
+        var maxConcurrentInferences = configuration.GetValue("ObjectDetection:MaxConcurrentInferences", 0);
+        if (maxConcurrentInferences > 0)
+        {
+            _inferenceGate = new SemaphoreSlim(maxConcurrentInferences, maxConcurrentInferences);
+        }
         
         // Initialize model if it exists
         if (File.Exists(_modelPath))
         {
             try
             {
-                _session = new InferenceSession(_modelPath);
+                _session = OnnxSessionFactory.Create(_modelPath, configuration, _logger);
+
+                // Look the graph's input and output names up once instead of on every run
+                _inputName = _session.InputMetadata.Keys.First();
+                _outputNames = new[] { _session.OutputMetadata.Keys.First() };
+
+                _halfInput = _session.InputMetadata[_inputName].ElementType == typeof(Float16);
+                _halfOutput = _session.OutputMetadata[_outputNames[0]].ElementType == typeof(Float16);
+
+                var outputDimensions = _session.OutputMetadata[_outputNames[0]].Dimensions;
+                if (outputDimensions.All(d => d > 0) && !_halfInput && !_halfOutput)
+                {
+                    _outputDimensions = outputDimensions;
+                    _outputShape = Array.ConvertAll(outputDimensions, d => (long)d);
+                    _outputLength = outputDimensions.Aggregate(1, (length, d) => length * d);
+                }
+
+                NonMaxSuppression.Warmup();
                 _logger.LogModelLoaded(_modelPath);
+
+                // Models exported with --batch N take N images per run; queue requests into batches
+                var inputDimensions = _session.InputMetadata[_inputName].Dimensions;
+                if (inputDimensions.Length == 4 && inputDimensions[0] > 1)
+                {
+                    var batchTimeout = TimeSpan.FromMilliseconds(configuration.GetValue("ObjectDetection:BatchTimeoutMs", 5.0));
+                    _batcher = new InferenceBatcher(inputDimensions, batchTimeout, RunBatch);
+                    _logger.LogInferenceBatchingEnabled(_batcher.BatchSize, batchTimeout.TotalMilliseconds);
+                }
             }
             catch (Exception ex)
             {
                 _logger.LogModelLoadWarning(_modelPath, ex);
             }
+
+            // Warm up last and on its own, so a failed warmup only costs first-request latency
+            // and cannot leave the service without the inference path the model needs
+            if (_session != null)
+            {
+                try
+                {
+                    WarmupSession(_session.InputMetadata[_inputName].Dimensions);
+                }
+                catch (Exception ex)
+                {
+                    _logger.LogModelWarmupFailed(_modelPath, ex);
+                }
+            }
         }
         else
         {
@@ -68,37 +127,16 @@ public class ObjectDetectionService : IObjectDetectionService, IDisposable
                 "When running from Aspire, ensure the yolo-model-export container has completed and the model exists in the shared volume.");
         }
 
+        // Pooled input buffer, so each request does not allocate a fresh 4.9 MB tensor
+        var inputBuffer = ArrayPool<float>.Shared.Rent(YoloPreprocessor.GetInputLength(InputWidth, InputHeight));
         try
         {
-
-            using var image = Image.Load<Rgb24>(imageBytes);
-            var originalWidth = image.Width;
-            var originalHeight = image.Height;
-
-            // Resize image to model input size
-            image.Mutate(x => x.Resize(InputWidth, InputHeight));
-
-            // Prepare input tensor
-            var input = new DenseTensor<float>(new[] { 1, 3, InputHeight, InputWidth });
-            for (int y = 0; y < InputHeight; y++)
-            {
-                for (int x = 0; x < InputWidth; x++)
-                {
-                    var pixel = image[x, y];
-                    input[0, 0, y, x] = pixel.R / 255f;
-                    input[0, 1, y, x] = pixel.G / 255f;
-                    input[0, 2, y, x] = pixel.B / 255f;
-                }
-            }
+            // Decode, resize and normalize into an NCHW tensor (batch, channels, height, width)
+            var (input, originalWidth, originalHeight) = YoloPreprocessor.CreateInputTensor(imageBytes, InputWidth, InputHeight, inputBuffer);
 
             // Run inference
-            var inputs = new List<NamedOnnxValue>
-            {
-                NamedOnnxValue.CreateFromTensor("images", input)
-            };
-
-            using var results = _session.Run(inputs);
-            var output = results.First().AsTensor<float>();
+            var (output, results) = await InferAsync(_session, input);
+            using var ownedResults = results;
 
             // Parse YOLO output and filter for persons (class 0 in COCO dataset)
             var detections = ParseYoloOutput(output, originalWidth, originalHeight);
@@ -111,6 +149,10 @@ public class ObjectDetectionService : IObjectDetectionService, IDisposable
             _logger.LogObjectDetectionError(ex);
             throw; // Re-throw instead of returning empty list
         }
+        finally
+        {
+            ArrayPool<float>.Shared.Return(inputBuffer);
+        }
     }
 
     public async Task<List<DetectedObject>> DetectObjectsAsync(byte[] imageBytes)
@@ -122,36 +164,16 @@ public class ObjectDetectionService : IObjectDetectionService, IDisposable
                 "When running from Aspire, ensure the yolo-model-export container has completed and the model exists in the shared volume.");
         }
 
+        // Pooled input buffer, so each request does not allocate a fresh 4.9 MB tensor
+        var inputBuffer = ArrayPool<float>.Shared.Rent(YoloPreprocessor.GetInputLength(InputWidth, InputHeight));
         try
         {
-            using var image = Image.Load<Rgb24>(imageBytes);
-            var originalWidth = image.Width;
-            var originalHeight = image.Height;
-
-            // Resize image to model input size
-            image.Mutate(x => x.Resize(InputWidth, InputHeight));
-
-            // Prepare input tensor
-            var input = new DenseTensor<float>(new[] { 1, 3, InputHeight, InputWidth });
-            for (int y = 0; y < InputHeight; y++)
-            {
-                for (int x = 0; x < InputWidth; x++)
-                {
-                    var pixel = image[x, y];
-                    input[0, 0, y, x] = pixel.R / 255f;
-                    input[0, 1, y, x] = pixel.G / 255f;
-                    input[0, 2, y, x] = pixel.B / 255f;
-                }
-            }
+            // Decode, resize and normalize into an NCHW tensor (batch, channels, height, width)
+            var (input, originalWidth, originalHeight) = YoloPreprocessor.CreateInputTensor(imageBytes, InputWidth, InputHeight, inputBuffer);
 
             // Run inference
-            var inputs = new List<NamedOnnxValue>
-            {
-                NamedOnnxValue.CreateFromTensor("images", input)
-            };
-
-            using var results = _session.Run(inputs);
-            var output = results.First().AsTensor<float>();
+            var (output, results) = await InferAsync(_session, input);
+            using var ownedResults = results;
 
             // Parse YOLO output for persons and accessories
             var detections = ParseYoloOutputForObjects(output, originalWidth, originalHeight);
@@ -167,120 +189,118 @@ public class ObjectDetectionService : IObjectDetectionService, IDisposable
             _logger.LogObjectDetectionError(ex);
             throw;
         }
+        finally
+        {
+            ArrayPool<float>.Shared.Return(inputBuffer);
+        }
     }
 
-    private List<BoundingBox> ParseYoloOutput(Tensor<float> output, int originalWidth, int originalHeight)
+    internal List<BoundingBox> ParseYoloOutput(Tensor<float> output, int originalWidth, int originalHeight)
     {
         var detections = new List<BoundingBox>();
         var dims = output.Dimensions.ToArray();
         
         // YOLO11 output format: [batch, 84, 8400] where 84 = 4 (bbox) + 80 (classes)
         // YOLO11 uses the same output format as YOLOv8
-        int numDetections = dims.Length > 2 ? dims[2] : MaxDetections;
-        
-        for (int i = 0; i < numDetections; i++)
+        // Models exported with NMS in the graph output [batch, 300, 6] final detections instead
+        var endToEnd = IsEndToEndOutput(dims);
+        int numDetections = endToEnd ? dims[1] : dims.Length > 2 ? dims[2] : MaxDetections;
+        var data = GetOutputData(output);
+
+        // Model-to-image scale factors, computed once per frame instead of once per box
+        var scaleX = (float)originalWidth / InputWidth;
+        var scaleY = (float)originalHeight / InputHeight;
+
+        if (endToEnd)
         {
-            // Get class scores (skip first 4 bbox coordinates)
-            float maxScore = 0;
-            int maxClass = 0;
-            
-            for (int c = 0; c < NumCocoClasses; c++)
+            for (int i = 0; i < numDetections; i++)
             {
-                var score = output[0, 4 + c, i];
-                if (score > maxScore)
+                var row = data.Slice(i * EndToEndRowLength, EndToEndRowLength);
+                if ((int)row[5] == 0 && row[4] >= ConfidenceThreshold)
                 {
-                    maxScore = score;
-                    maxClass = c;
+                    detections.Add(CreateBoundingBoxFromCorners(data, i, scaleX, scaleY, row[4], "person"));
                 }
             }
 
-            // Check if it's a person (class 0) and meets confidence threshold
-            if (maxClass == 0 && maxScore >= ConfidenceThreshold)
+            // NMS already ran in the graph
+            return detections;
+        }
+
+        // YOLO11 class scores are independent sigmoids, so the person row alone decides whether a
+        // detection is a person; the other 79 class rows are never read
+        var personScores = data.Slice(4 * numDetections, numDetections);
+        var candidates = ArrayPool<int>.Shared.Rent(numDetections);
+        try
+        {
+            var personCount = SimdMath.IndicesAtOrAbove(personScores, ConfidenceThreshold, candidates);
+
+            // Apply Non-Maximum Suppression on flat box arrays; only the kept boxes become BoundingBox objects
+            foreach (var k in ApplyNMS(data, numDetections, candidates.AsSpan(0, personCount), scaleX, scaleY))
             {
-                var cx = output[0, 0, i];
-                var cy = output[0, 1, i];
-                var w = output[0, 2, i];
-                var h = output[0, 3, i];
-
-                // Convert from model coordinates to original image coordinates
-                var x = (cx - w / 2) * originalWidth / InputWidth;
-                var y = (cy - h / 2) * originalHeight / InputHeight;
-                var width = w * originalWidth / InputWidth;
-                var height = h * originalHeight / InputHeight;
-
-                detections.Add(new BoundingBox
-                {
-                    X = x,
-                    Y = y,
-                    Width = width,
-                    Height = height,
-                    Confidence = maxScore,
-                    Label = "person"
-                });
+                var i = candidates[k];
+                detections.Add(CreateBoundingBox(data, numDetections, i, scaleX, scaleY, personScores[i], "person"));
             }
         }
+        finally
+        {
+            ArrayPool<int>.Shared.Return(candidates);
+        }
 
-        // Apply Non-Maximum Suppression
-        return ApplyNMS(detections);
+        return detections;
     }
 
-    private List<DetectedObject> ParseYoloOutputForObjects(Tensor<float> output, int originalWidth, int originalHeight)
+    internal List<DetectedObject> ParseYoloOutputForObjects(Tensor<float> output, int originalWidth, int originalHeight)
     {
         var detections = new List<DetectedObject>();
         var dims = output.Dimensions.ToArray();
         
         // YOLO11 output format: [batch, 84, 8400] where 84 = 4 (bbox) + 80 (classes)
-        int numDetections = dims.Length > 2 ? dims[2] : MaxDetections;
+        // Models exported with NMS in the graph output [batch, 300, 6] final detections instead
+        var endToEnd = IsEndToEndOutput(dims);
+        int numDetections = endToEnd ? dims[1] : dims.Length > 2 ? dims[2] : MaxDetections;
+        var data = GetOutputData(output);
         
         int personCount = 0;
         int accessoryCount = 0;
         int backpacksFiltered = 0;
-        
-        for (int i = 0; i < numDetections; i++)
+
+        // Model-to-image scale factors, computed once per frame instead of once per box
+        var scaleX = (float)originalWidth / InputWidth;
+        var scaleY = (float)originalHeight / InputHeight;
+
+        // Best class and score for every detection, reduced row by row over the contiguous class scores
+        var maxScores = ArrayPool<float>.Shared.Rent(numDetections);
+        var maxClasses = ArrayPool<int>.Shared.Rent(numDetections);
+        try
         {
-            // Get class scores (skip first 4 bbox coordinates)
-            float maxScore = 0;
-            int maxClass = 0;
-            
-            for (int c = 0; c < NumCocoClasses; c++)
+            ReadBestClasses(data, numDetections, endToEnd, maxScores, maxClasses);
+
+            for (int i = 0; i < numDetections; i++)
             {
-                var score = output[0, 4 + c, i];
-                if (score > maxScore)
+                var maxScore = maxScores[i];
+                var maxClass = maxClasses[i];
+
+                // Only persons and accessories are of interest
+                if (maxClass != 0 && !AccessoryClassIds.Contains(maxClass))
                 {
-                    maxScore = score;
-                    maxClass = c;
+                    continue;
                 }
-            }
 
-            // Log potential detections for persons and accessories (even if filtered)
-            if (maxClass == 0 || AccessoryClassIds.Contains(maxClass))
-            {
+                // Log potential detections for persons and accessories (even if filtered)
                 var threshold = maxClass == 0 ? ConfidenceThreshold : _accessoryConfidenceThreshold;
                 var passes = maxScore >= threshold;
                 _logger.LogRawYoloDetection(maxClass, maxScore, threshold, passes);
-                
-                // Specifically track backpack filtering
-                if (maxClass == 24 && !passes)
+
+                if (!passes)
                 {
-                    _logger.LogBackpackFilteredByConfidence(maxScore, threshold);
-                    backpacksFiltered++;
+                    // Specifically track backpack filtering
+                    if (maxClass == 24)
+                    {
+                        _logger.LogBackpackFilteredByConfidence(maxScore, threshold);
+                        backpacksFiltered++;
+                    }
+                    continue;
                 }
-            }
-
-            // Check if it's a person (class 0) or an accessory class and meets confidence threshold
-            var detectionThreshold = maxClass == 0 ? ConfidenceThreshold : _accessoryConfidenceThreshold;
-            if ((maxClass == 0 || AccessoryClassIds.Contains(maxClass)) && maxScore >= detectionThreshold)
-            {
-                var cx = output[0, 0, i];
-                var cy = output[0, 1, i];
-                var w = output[0, 2, i];
-                var h = output[0, 3, i];
-
-                // Convert from model coordinates to original image coordinates
-                var x = (cx - w / 2) * originalWidth / InputWidth;
-                var y = (cy - h / 2) * originalHeight / InputHeight;
-                var width = w * originalWidth / InputWidth;
-                var height = h * originalHeight / InputHeight;
 
                 var label = CocoClassNames.TryGetValue(maxClass, out var className) ? className : $"class_{maxClass}";
 
@@ -288,21 +308,20 @@ public class ObjectDetectionService : IObjectDetectionService, IDisposable
                 {
                     ClassId = maxClass,
                     ObjectType = label,
-                    BoundingBox = new BoundingBox
-                    {
-                        X = x,
-                        Y = y,
-                        Width = width,
-                        Height = height,
-                        Confidence = maxScore,
-                        Label = label
-                    }
+                    BoundingBox = endToEnd
+                        ? CreateBoundingBoxFromCorners(data, i, scaleX, scaleY, maxScore, label)
+                        : CreateBoundingBox(data, numDetections, i, scaleX, scaleY, maxScore, label)
                 });
                 
                 if (maxClass == 0) personCount++;
-                else if (AccessoryClassIds.Contains(maxClass)) accessoryCount++;
+                else accessoryCount++;
             }
         }
+        finally
+        {
+            ArrayPool<float>.Shared.Return(maxScores);
+            ArrayPool<int>.Shared.Return(maxClasses);
+        }
 
         _logger.LogYoloParsingComplete(numDetections, personCount, accessoryCount);
         
@@ -311,8 +330,252 @@ public class ObjectDetectionService : IObjectDetectionService, IDisposable
             _logger.LogInformation("Filtered out {BackpackCount} backpack detections due to low confidence", backpacksFiltered);
         }
 
-        // Apply Non-Maximum Suppression per class
-        return ApplyNMSPerClass(detections);
+        // Apply Non-Maximum Suppression per class, unless the model already did
+        return endToEnd ? detections : ApplyNMSPerClass(detections);
+    }
+
+    /// <summary>
+    /// Convert detection <paramref name="index"/> from the model's centre/size format at 640x640
+    /// into a top-left/size box in original image coordinates.
+    /// </summary>
+    private static BoundingBox CreateBoundingBox(ReadOnlySpan<float> data, int numDetections, int index,
+        float scaleX, float scaleY, float confidence, string label)
+    {
+        var cx = data[index];
+        var cy = data[numDetections + index];
+        var w = data[2 * numDetections + index];
+        var h = data[3 * numDetections + index];
+
+        return new BoundingBox
+        {
+            X = (cx - w * 0.5f) * scaleX,
+            Y = (cy - h * 0.5f) * scaleY,
+            Width = w * scaleX,
+            Height = h * scaleY,
+            Confidence = confidence,
+            Label = label
+        };
+    }
+
+    /// <summary>
+    /// Run inference on one image, through the batcher when the model takes fixed batches.
+    /// The returned results own the output's memory (native, or a pooled buffer when the output
+    /// shape is fixed) and must be disposed after parsing; they are null for batched runs.
+    /// </summary>
+    private async Task<(Tensor<float> Output, IDisposable? Results)> InferAsync(InferenceSession session, DenseTensor<float> input)
+    {
+        if (_batcher != null)
+        {
+            return (await _batcher.RunAsync(input.Buffer), null);
+        }
+
+        if (_outputDimensions != null)
+        {
+            var outputBuffer = new PooledBuffer(_outputLength);
+            try
+            {
+                var output = await RunGatedAsync(() => RunWithBinding(session, input, outputBuffer.Memory));
+                return (output, outputBuffer);
+            }
+            catch
+            {
+                outputBuffer.Dispose();
+                throw;
+            }
+        }
+
+        var inputs = new List<NamedOnnxValue>
+        {
+            CreateInput(input)
+        };
+
+        var results = await RunGatedAsync(() => session.Run(inputs, _outputNames));
+        return (ReadOutput(results.First()), results);
+    }
+
+    /// <summary>
+    /// Run the session with the input and output bound to managed buffers: ONNX Runtime reads the
+    /// (pooled) input in place and writes the output straight into <paramref name="output"/>,
+    /// instead of allocating a native output per run that is then wrapped and copied out.
+    /// </summary>
+    private DenseTensor<float> RunWithBinding(InferenceSession session, DenseTensor<float> input, Memory<float> output)
+    {
+        using var inputValue = OrtValue.CreateTensorValueFromMemory(OrtMemoryInfo.DefaultInstance, input.Buffer, InputShape);
+        using var outputValue = OrtValue.CreateTensorValueFromMemory(OrtMemoryInfo.DefaultInstance, output, _outputShape);
+        using var binding = session.CreateIoBinding();
+        using var runOptions = new RunOptions();
+
+        binding.BindInput(_inputName, inputValue);
+        binding.BindOutput(_outputNames[0], outputValue);
+        session.RunWithBinding(runOptions, binding);
+
+        return new DenseTensor<float>(output, _outputDimensions);
+    }
+
+    /// <summary>
+    /// Run one full batch for the batcher, copying the output out of the native results.
+    /// Each batch run takes one inference slot, like a single-image run.
+    /// </summary>
+    private DenseTensor<float> RunBatch(DenseTensor<float> batch)
+    {
+        _inferenceGate?.Wait();
+        try
+        {
+            using var results = _session!.Run(new List<NamedOnnxValue>
+            {
+                CreateInput(batch)
+            }, _outputNames);
+            var output = ReadOutput(results.First());
+            return new DenseTensor<float>(GetOutputData(output).ToArray(), output.Dimensions);
+        }
+        finally
+        {
+            _inferenceGate?.Release();
+        }
+    }
+
+    /// <summary>
+    /// Run one inference on a blank input, so ONNX Runtime's kernel selection and buffer
+    /// allocations happen while the model loads instead of delaying the first request.
+    /// </summary>
+    private void WarmupSession(int[] inputDimensions)
+    {
+        var dimensions = inputDimensions.All(d => d > 0) ? inputDimensions : new[] { 1, 3, InputHeight, InputWidth };
+        var stopwatch = Stopwatch.StartNew();
+
+        using var results = _session!.Run(new List<NamedOnnxValue>
+        {
+            CreateInput(new DenseTensor<float>(dimensions))
+        }, _outputNames);
+
+        _logger.LogModelWarmedUp(_modelPath, stopwatch.Elapsed.TotalMilliseconds);
+    }
+
+    /// <summary>
+    /// Wrap the preprocessed input for the session, converted to FP16 when the model takes FP16 input.
+    /// </summary>
+    private NamedOnnxValue CreateInput(DenseTensor<float> input)
+    {
+        return _halfInput
+            ? NamedOnnxValue.CreateFromTensor(_inputName, ToHalfTensor(input))
+            : NamedOnnxValue.CreateFromTensor(_inputName, input);
+    }
+
+    /// <summary>
+    /// Read the model output as FP32, widening it first when the model returns FP16.
+    /// </summary>
+    private Tensor<float> ReadOutput(DisposableNamedOnnxValue output)
+    {
+        return _halfOutput ? ToFloatTensor(output.AsTensor<Float16>()) : output.AsTensor<float>();
+    }
+
+    /// <summary>
+    /// Copy an FP32 tensor into an FP16 tensor of the same shape.
+    /// </summary>
+    internal static DenseTensor<Float16> ToHalfTensor(DenseTensor<float> input)
+    {
+        var source = input.Buffer.Span;
+        var half = new Float16[source.Length];
+        for (int i = 0; i < source.Length; i++)
+        {
+            half[i] = (Float16)source[i];
+        }
+
+        return new DenseTensor<Float16>(half, input.Dimensions);
+    }
+
+    /// <summary>
+    /// Copy an FP16 tensor into an FP32 tensor of the same shape.
+    /// </summary>
+    internal static DenseTensor<float> ToFloatTensor(Tensor<Float16> half)
+    {
+        var values = new float[half.Length];
+        var index = 0;
+        foreach (var value in half)
+        {
+            values[index++] = (float)value;
+        }
+
+        return new DenseTensor<float>(values, half.Dimensions);
+    }
+
+    /// <summary>
+    /// Run the session, waiting for a free inference slot first when concurrency is bounded.
+    /// </summary>
+    private async Task<T> RunGatedAsync<T>(Func<T> run)
+    {
+        if (_inferenceGate == null)
+        {
+            return run();
+        }
+
+        await _inferenceGate.WaitAsync();
+        try
+        {
+            return run();
+        }
+        finally
+        {
+            _inferenceGate.Release();
+        }
+    }
+
+    /// <summary>
+    /// Whether the output is the [batch, detections, 6] layout of a model exported with NMS in the graph.
+    /// </summary>
+    private static bool IsEndToEndOutput(int[] dims)
+    {
+        return dims.Length == 3 && dims[2] == EndToEndRowLength;
+    }
+
+    /// <summary>
+    /// Fill the best class and its score for each detection, from the raw class score rows or,
+    /// for end-to-end output, from the score and class columns the in-graph NMS already chose.
+    /// </summary>
+    private static void ReadBestClasses(ReadOnlySpan<float> data, int numDetections, bool endToEnd,
+        Span<float> maxScores, Span<int> maxClasses)
+    {
+        if (!endToEnd)
+        {
+            SimdMath.ArgMaxColumns(data.Slice(4 * numDetections, NumCocoClasses * numDetections),
+                NumCocoClasses, numDetections, maxScores, maxClasses);
+            return;
+        }
+
+        for (int i = 0; i < numDetections; i++)
+        {
+            var row = data.Slice(i * EndToEndRowLength, EndToEndRowLength);
+            maxScores[i] = row[4];
+            maxClasses[i] = (int)row[5];
+        }
+    }
+
+    /// <summary>
+    /// Convert end-to-end row <paramref name="index"/> from corner coordinates at 640x640
+    /// into a top-left/size box in original image coordinates.
+    /// </summary>
+    private static BoundingBox CreateBoundingBoxFromCorners(ReadOnlySpan<float> data, int index,
+        float scaleX, float scaleY, float confidence, string label)
+    {
+        var row = data.Slice(index * EndToEndRowLength, EndToEndRowLength);
+
+        return new BoundingBox
+        {
+            X = row[0] * scaleX,
+            Y = row[1] * scaleY,
+            Width = (row[2] - row[0]) * scaleX,
+            Height = (row[3] - row[1]) * scaleY,
+            Confidence = confidence,
+            Label = label
+        };
+    }
+
+    /// <summary>
+    /// Get the output tensor as one contiguous row-major span, so each of its 84 rows can be scanned sequentially.
+    /// </summary>
+    private static ReadOnlySpan<float> GetOutputData(Tensor<float> output)
+    {
+        return (output as DenseTensor<float> ?? output.ToDenseTensor()).Buffer.Span;
     }
 
     private List<DetectedObject> ApplyNMSPerClass(List<DetectedObject> objects)
@@ -324,58 +587,76 @@ public class ObjectDetectionService : IObjectDetectionService, IDisposable
         
         foreach (var classGroup in groupedByClass)
         {
-            var sortedObjects = classGroup.OrderByDescending(o => o.BoundingBox.Confidence).ToList();
-            
-            while (sortedObjects.Any())
+            var classObjects = classGroup.ToList();
+            var kept = NonMaxSuppression.Apply(classObjects.Select(o => o.BoundingBox).ToList(), IouThreshold);
+            foreach (var index in kept)
             {
-                var current = sortedObjects.First();
-                result.Add(current);
-                sortedObjects.RemoveAt(0);
-                
-                sortedObjects = sortedObjects.Where(obj => 
-                    CalculateIoU(current.BoundingBox, obj.BoundingBox) < IouThreshold).ToList();
+                result.Add(classObjects[index]);
             }
         }
         
         return result;
     }
 
-    private List<BoundingBox> ApplyNMS(List<BoundingBox> boxes)
+    /// <summary>
+    /// Run NMS over the raw-output person detections at <paramref name="indices"/>, in original image
+    /// coordinates, and return the positions in <paramref name="indices"/> of the kept ones.
+    /// </summary>
+    private static List<int> ApplyNMS(ReadOnlySpan<float> data, int numDetections, ReadOnlySpan<int> indices,
+        float scaleX, float scaleY)
     {
-        var result = new List<BoundingBox>();
-        var sortedBoxes = boxes.OrderByDescending(b => b.Confidence).ToList();
-
-        while (sortedBoxes.Any())
+        var count = indices.Length;
+        var boxes = ArrayPool<float>.Shared.Rent(5 * count);
+        try
         {
-            var current = sortedBoxes.First();
-            result.Add(current);
-            sortedBoxes.RemoveAt(0);
+            var x = boxes.AsSpan(0, count);
+            var y = boxes.AsSpan(count, count);
+            var widths = boxes.AsSpan(2 * count, count);
+            var heights = boxes.AsSpan(3 * count, count);
+            var scores = boxes.AsSpan(4 * count, count);
+            for (int k = 0; k < count; k++)
+            {
+                var i = indices[k];
+                var w = data[2 * numDetections + i];
+                var h = data[3 * numDetections + i];
+                x[k] = (data[i] - w * 0.5f) * scaleX;
+                y[k] = (data[numDetections + i] - h * 0.5f) * scaleY;
+                widths[k] = w * scaleX;
+                heights[k] = h * scaleY;
+                scores[k] = data[4 * numDetections + i];
+            }
 
-            sortedBoxes = sortedBoxes.Where(box => 
-                CalculateIoU(current, box) < IouThreshold).ToList();
+            return NonMaxSuppression.Apply(x, y, widths, heights, scores, IouThreshold);
+        }
+        finally
+        {
+            ArrayPool<float>.Shared.Return(boxes);
         }
-
-        return result;
     }
 
-    private float CalculateIoU(BoundingBox box1, BoundingBox box2)
+    /// <summary>
+    /// An output buffer rented from the shared pool for one run, returned when the caller has parsed it.
+    /// </summary>
+    private sealed class PooledBuffer : IDisposable
     {
-        var x1 = Math.Max(box1.X, box2.X);
-        var y1 = Math.Max(box1.Y, box2.Y);
-        var x2 = Math.Min(box1.X + box1.Width, box2.X + box2.Width);
-        var y2 = Math.Min(box1.Y + box1.Height, box2.Y + box2.Height);
+        private readonly float[] _buffer;
+
+        public PooledBuffer(int length)
+        {
+            _buffer = ArrayPool<float>.Shared.Rent(length);
+            Memory = _buffer.AsMemory(0, length);
+        }
 
-        var intersectionArea = Math.Max(0, x2 - x1) * Math.Max(0, y2 - y1);
-        var box1Area = box1.Width * box1.Height;
-        var box2Area = box2.Width * box2.Height;
-        var unionArea = box1Area + box2Area - intersectionArea;
+        public Memory<float> Memory { get; }
 
-        return unionArea > 0 ? intersectionArea / unionArea : 0;
+        public void Dispose() => ArrayPool<float>.Shared.Return(_buffer);
     }
 
     public void Dispose()
     {
+        _batcher?.Dispose();
         _session?.Dispose();
+        _inferenceGate?.Dispose();
         GC.SuppressFinalize(this);
     }
 }
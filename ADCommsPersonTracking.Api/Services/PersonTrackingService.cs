@@ -122,13 +122,14 @@ public class PersonTrackingService : IPersonTrackingService
                         var imageIndex = imageData.Index;
                         var imageBytes = Convert.FromBase64String(imageBase64);
 
-                        // Get image dimensions first for logging
+                        // Get image dimensions first for logging; only the header is read, since
+                        // the detectors decode the pixels themselves
                         int imageHeight, imageWidth;
                         using (var ms = new MemoryStream(imageBytes))
-                        using (var image = await SixLabors.ImageSharp.Image.LoadAsync(ms, cancellationToken))
                         {
-                            imageHeight = image.Height;
-                            imageWidth = image.Width;
+                            var imageInfo = await SixLabors.ImageSharp.Image.IdentifyAsync(ms, cancellationToken);
+                            imageHeight = imageInfo.Height;
+                            imageWidth = imageInfo.Width;
                         }
 
                         _logger.LogImageProcessingStart(imageIndex, imageWidth, imageHeight, imageBase64.Length);
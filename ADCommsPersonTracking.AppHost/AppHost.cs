@@ -4,17 +4,25 @@ var builder = DistributedApplication.CreateBuilder(args);
 var yoloConfig = builder.Configuration.GetSection("Yolo11");
 var yoloModel = yoloConfig["Model"] ?? "yolo11m.onnx";
 
+// The model may name an exported variant (e.g. yolo11x.int8.onnx); the export takes the base model name
+var yoloBaseModel = Path.GetFileNameWithoutExtension(yoloModel).Split('.')[0];
+
 // Define shared model directory path (relative to solution root)
 var modelsPath = Path.GetFullPath(Path.Combine(Directory.GetCurrentDirectory(), "..", "models"));
 Directory.CreateDirectory(modelsPath);
 
-// Add YOLO11 model export container (runs once to export the model to shared volume)
-var yoloModelExport = builder.AddContainer("yolo-model-export", "yolo-model-export")
-    .WithBindMount(modelsPath, "/models");
+// Add YOLO11 model export container (runs once to export the configured model to shared volume)
+// The named cache volume keeps downloaded weights so re-exports skip the network fetch
+var yoloModelExport = builder.AddContainer("yolo-model-export", "model-export")
+    .WithBindMount(modelsPath, "/models")
+    .WithVolume("model-export-cache", "/root/.cache")
+    .WithArgs("--model", yoloBaseModel, "--half", "--int8");
 
 // Add fashion model export container (runs once to export the fashion model to shared volume)
-var fashionModelExport = builder.AddContainer("fashion-model-export", "fashion-model-export")
-    .WithBindMount(modelsPath, "/models");
+var fashionModelExport = builder.AddContainer("fashion-model-export", "model-export")
+    .WithBindMount(modelsPath, "/models")
+    .WithVolume("model-export-cache", "/root/.cache")
+    .WithArgs("--model", "fashion-yolo", "--half", "--int8");
 
 // Add Azure Blob Storage emulator (Azurite)
 var storage = builder.AddAzureStorage("storage")
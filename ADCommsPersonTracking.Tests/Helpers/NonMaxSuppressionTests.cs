@@ -0,0 +1,99 @@
+using ADCommsPersonTracking.Api.Helpers;
+using ADCommsPersonTracking.Api.Models;
+using FluentAssertions;
+
+namespace ADCommsPersonTracking.Tests.Helpers;
+
+public class NonMaxSuppressionTests
+{
+    [Fact]
+    public void Apply_WithNoBoxes_ShouldReturnEmpty()
+    {
+        // Act
+        var kept = NonMaxSuppression.Apply(new List<BoundingBox>(), 0.5f);
+
+        // Assert
+        kept.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void Apply_WithOverlappingBoxes_ShouldKeepHighestConfidence()
+    {
+        // Arrange
+        var boxes = new List<BoundingBox>
+        {
+            new() { X = 12, Y = 12, Width = 100, Height = 100, Confidence = 0.8f },
+            new() { X = 10, Y = 10, Width = 100, Height = 100, Confidence = 0.9f },
+            new() { X = 300, Y = 300, Width = 50, Height = 50, Confidence = 0.7f }
+        };
+
+        // Act
+        var kept = NonMaxSuppression.Apply(boxes, 0.5f);
+
+        // Assert
+        kept.Should().Equal(1, 2);
+    }
+
+    [Fact]
+    public void Apply_WithNoOverlap_ShouldKeepAllBoxesInConfidenceOrder()
+    {
+        // Arrange
+        var boxes = new List<BoundingBox>
+        {
+            new() { X = 0, Y = 0, Width = 50, Height = 50, Confidence = 0.6f },
+            new() { X = 100, Y = 100, Width = 50, Height = 50, Confidence = 0.9f },
+            new() { X = 200, Y = 200, Width = 50, Height = 50, Confidence = 0.6f }
+        };
+
+        // Act
+        var kept = NonMaxSuppression.Apply(boxes, 0.5f);
+
+        // Assert - equal confidences keep their input order
+        kept.Should().Equal(1, 0, 2);
+    }
+
+    [Fact]
+    public void Apply_ShouldOnlySuppressAgainstKeptBoxes()
+    {
+        // Arrange - B overlaps A and C, but A and C do not overlap each other
+        var boxes = new List<BoundingBox>
+        {
+            new() { X = 0, Y = 0, Width = 100, Height = 100, Confidence = 0.9f },
+            new() { X = 30, Y = 0, Width = 100, Height = 100, Confidence = 0.8f },
+            new() { X = 60, Y = 0, Width = 100, Height = 100, Confidence = 0.7f }
+        };
+
+        // Act
+        var kept = NonMaxSuppression.Apply(boxes, 0.5f);
+
+        // Assert - B is suppressed by A, so it cannot suppress C
+        kept.Should().Equal(0, 2);
+    }
+
+    [Fact]
+    public void Apply_WithParallelArrays_ShouldMatchBoundingBoxOverload()
+    {
+        // Arrange
+        var random = new Random(3);
+        var boxes = Enumerable.Range(0, 50).Select(_ => new BoundingBox
+        {
+            X = random.Next(0, 200),
+            Y = random.Next(0, 200),
+            Width = random.Next(10, 80),
+            Height = random.Next(10, 80),
+            Confidence = (float)random.NextDouble()
+        }).ToList();
+
+        // Act
+        var kept = NonMaxSuppression.Apply(
+            boxes.Select(b => b.X).ToArray(),
+            boxes.Select(b => b.Y).ToArray(),
+            boxes.Select(b => b.Width).ToArray(),
+            boxes.Select(b => b.Height).ToArray(),
+            boxes.Select(b => b.Confidence).ToArray(),
+            0.5f);
+
+        // Assert
+        kept.Should().Equal(NonMaxSuppression.Apply(boxes, 0.5f));
+    }
+}
@@ -0,0 +1,149 @@
+using ADCommsPersonTracking.Api.Helpers;
+using FluentAssertions;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.Logging;
+using Microsoft.ML.OnnxRuntime;
+using Moq;
+
+namespace ADCommsPersonTracking.Tests.Helpers;
+
+public class OnnxSessionFactoryTests : IDisposable
+{
+    private readonly Mock<ILogger> _loggerMock = new();
+    private readonly IConfiguration _configuration = new ConfigurationBuilder().Build();
+    private readonly string _modelPath = Path.Combine(Path.GetTempPath(), $"{Guid.NewGuid()}.onnx");
+
+    public void Dispose()
+    {
+        File.Delete(_modelPath + ".meta.json");
+    }
+
+    [Fact]
+    public void ReadProviderHints_WithoutHintsFile_ShouldReturnEmpty()
+    {
+        // Act
+        var hints = OnnxSessionFactory.ReadProviderHints(_modelPath, _loggerMock.Object);
+
+        // Assert
+        hints.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void ReadProviderHints_ShouldReturnProvidersInOrderWithStringOptions()
+    {
+        // Arrange
+        File.WriteAllText(_modelPath + ".meta.json", """
+            {
+              "providers": [
+                ["TensorrtExecutionProvider", {"trt_int8_enable": true}],
+                ["CUDAExecutionProvider", {}],
+                ["CPUExecutionProvider", {}]
+              ],
+              "input_shape": [1, 3, 640, 640],
+              "precision": "int8"
+            }
+            """);
+
+        // Act
+        var hints = OnnxSessionFactory.ReadProviderHints(_modelPath, _loggerMock.Object);
+
+        // Assert
+        hints.Select(h => h.Provider).Should().Equal(
+            "TensorrtExecutionProvider", "CUDAExecutionProvider", "CPUExecutionProvider");
+        hints[0].Options.Should().ContainKey("trt_int8_enable").WhoseValue.Should().Be("1");
+        hints[1].Options.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void ReadProviderHints_WithInvalidJson_ShouldReturnEmpty()
+    {
+        // Arrange
+        File.WriteAllText(_modelPath + ".meta.json", "{ not json");
+
+        // Act
+        var hints = OnnxSessionFactory.ReadProviderHints(_modelPath, _loggerMock.Object);
+
+        // Assert
+        hints.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void CreateSessionOptions_WithUnavailableProviders_ShouldFallBackToCpu()
+    {
+        // Arrange - the test host only ships the CPU build of ONNX Runtime
+        File.WriteAllText(_modelPath + ".meta.json", """
+            {"providers": [["TensorrtExecutionProvider", {"trt_fp16_enable": true}], ["CPUExecutionProvider", {}]]}
+            """);
+
+        // Act
+        var act = () => OnnxSessionFactory.CreateSessionOptions(_modelPath, _configuration, _loggerMock.Object).Dispose();
+
+        // Assert
+        act.Should().NotThrow();
+    }
+
+    [Fact]
+    public void CreateSessionOptions_ShouldApplyConfiguredThreadCount()
+    {
+        // Arrange
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                ["OnnxRuntime:IntraOpNumThreads"] = "3"
+            })
+            .Build();
+
+        // Act
+        using var options = OnnxSessionFactory.CreateSessionOptions(_modelPath, configuration, _loggerMock.Object);
+
+        // Assert
+        options.IntraOpNumThreads.Should().Be(3);
+        options.GraphOptimizationLevel.Should().Be(GraphOptimizationLevel.ORT_ENABLE_ALL);
+    }
+
+    [Fact]
+    public void ResolveProviders_WithConfiguredProviders_ShouldOverrideHintOrderAndKeepOptions()
+    {
+        // Arrange
+        File.WriteAllText(_modelPath + ".meta.json", """
+            {"providers": [["TensorrtExecutionProvider", {"trt_int8_enable": true}], ["CUDAExecutionProvider", {}], ["CPUExecutionProvider", {}]]}
+            """);
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                ["OnnxRuntime:ExecutionProviders:0"] = "OpenVINOExecutionProvider",
+                ["OnnxRuntime:ExecutionProviders:1"] = "TensorrtExecutionProvider",
+                ["OnnxRuntime:ExecutionProviders:2"] = "CPUExecutionProvider"
+            })
+            .Build();
+
+        // Act
+        var providers = OnnxSessionFactory.ResolveProviders(_modelPath, configuration, _loggerMock.Object);
+
+        // Assert
+        providers.Select(p => p.Provider).Should().Equal(
+            "OpenVINOExecutionProvider", "TensorrtExecutionProvider", "CPUExecutionProvider");
+        providers[0].Options.Should().BeEmpty();
+        providers[1].Options.Should().ContainKey("trt_int8_enable");
+    }
+
+    [Fact]
+    public void CreateSessionOptions_ShouldApplyConfiguredExecutionMode()
+    {
+        // Arrange
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                ["OnnxRuntime:ExecutionMode"] = "ORT_PARALLEL",
+                ["OnnxRuntime:InterOpNumThreads"] = "2"
+            })
+            .Build();
+
+        // Act
+        using var options = OnnxSessionFactory.CreateSessionOptions(_modelPath, configuration, _loggerMock.Object);
+
+        // Assert
+        options.ExecutionMode.Should().Be(ExecutionMode.ORT_PARALLEL);
+        options.InterOpNumThreads.Should().Be(2);
+    }
+}
@@ -174,4 +174,182 @@ public class SimdMathTests
         // Assert
         results.Should().AllSatisfy(r => r.Should().BeApproximately(expectedDistance, 0.001f));
     }
+
+    [Theory]
+    [InlineData(1)]
+    [InlineData(7)]
+    [InlineData(8)]
+    [InlineData(8400)]
+    public void ArgMaxColumns_ShouldMatchScalarArgMax(int columns)
+    {
+        // Arrange
+        const int rows = 80;
+        var random = new Random(42);
+        var matrix = Enumerable.Range(0, rows * columns).Select(_ => (float)random.NextDouble()).ToArray();
+        var maxValues = new float[columns];
+        var maxIndices = new int[columns];
+
+        // Act
+        SimdMath.ArgMaxColumns(matrix, rows, columns, maxValues, maxIndices);
+
+        // Assert
+        for (int c = 0; c < columns; c++)
+        {
+            var expectedRow = Enumerable.Range(0, rows).MaxBy(r => matrix[r * columns + c]);
+            maxIndices[c].Should().Be(expectedRow);
+            maxValues[c].Should().Be(matrix[expectedRow * columns + c]);
+        }
+    }
+
+    [Fact]
+    public void ArgMaxColumns_WithTies_ShouldReturnFirstRow()
+    {
+        // Arrange - every row holds the same values
+        var matrix = Enumerable.Repeat(0.5f, 3 * 10).ToArray();
+        var maxValues = new float[10];
+        var maxIndices = new int[10];
+
+        // Act
+        SimdMath.ArgMaxColumns(matrix, 3, 10, maxValues, maxIndices);
+
+        // Assert
+        maxIndices.Should().AllSatisfy(i => i.Should().Be(0));
+        maxValues.Should().AllSatisfy(v => v.Should().Be(0.5f));
+    }
+
+    [Fact]
+    public void ArgMaxColumns_WithTooSmallOutput_ShouldThrowArgumentException()
+    {
+        // Arrange
+        var matrix = new float[2 * 4];
+
+        // Act & Assert
+        var act = () => SimdMath.ArgMaxColumns(matrix, 2, 4, new float[3], new int[4]);
+        act.Should().Throw<ArgumentException>();
+    }
+
+    [Theory]
+    [InlineData(1)]
+    [InlineData(7)]
+    [InlineData(8)]
+    [InlineData(8400)]
+    public void IndicesAtOrAbove_ShouldMatchScalarFilter(int length)
+    {
+        // Arrange - include exact threshold values, which must be kept
+        var random = new Random(7);
+        var values = Enumerable.Range(0, length)
+            .Select(i => i % 5 == 0 ? 0.45f : (float)random.NextDouble())
+            .ToArray();
+        var indices = new int[length];
+
+        // Act
+        var count = SimdMath.IndicesAtOrAbove(values, 0.45f, indices);
+
+        // Assert
+        var expected = Enumerable.Range(0, length).Where(i => values[i] >= 0.45f).ToArray();
+        indices.Take(count).Should().Equal(expected);
+    }
+
+    [Fact]
+    public void IndicesAtOrAbove_WithTooSmallOutput_ShouldThrowArgumentException()
+    {
+        // Act & Assert
+        var act = () => SimdMath.IndicesAtOrAbove(new float[8], 0.5f, new int[7]);
+        act.Should().Throw<ArgumentException>();
+    }
+
+    [Theory]
+    [InlineData(1)]
+    [InlineData(7)]
+    [InlineData(8)]
+    [InlineData(37)]
+    public void CalculateIoUs_ShouldMatchScalarIoU(int length)
+    {
+        // Arrange - random boxes, plus one identical and one disjoint box
+        var random = new Random(11);
+        var x1s = new float[length];
+        var y1s = new float[length];
+        var x2s = new float[length];
+        var y2s = new float[length];
+        var areas = new float[length];
+        for (int i = 0; i < length; i++)
+        {
+            x1s[i] = (float)random.NextDouble() * 100;
+            y1s[i] = (float)random.NextDouble() * 100;
+            x2s[i] = x1s[i] + (float)random.NextDouble() * 50;
+            y2s[i] = y1s[i] + (float)random.NextDouble() * 50;
+        }
+        (x1s[0], y1s[0], x2s[0], y2s[0]) = (20f, 20f, 60f, 60f);
+        if (length > 1)
+        {
+            (x1s[^1], y1s[^1], x2s[^1], y2s[^1]) = (500f, 500f, 510f, 510f);
+        }
+        for (int i = 0; i < length; i++)
+        {
+            areas[i] = (x2s[i] - x1s[i]) * (y2s[i] - y1s[i]);
+        }
+        var results = new float[length];
+
+        // Act
+        SimdMath.CalculateIoUs(20f, 20f, 60f, 60f, 1600f, x1s, y1s, x2s, y2s, areas, results);
+
+        // Assert
+        for (int i = 0; i < length; i++)
+        {
+            var expected = SimdMath.CalculateIoU(20f, 20f, 40f, 40f, x1s[i], y1s[i], x2s[i] - x1s[i], y2s[i] - y1s[i]);
+            results[i].Should().BeApproximately(expected, 0.0001f);
+        }
+        results[0].Should().BeApproximately(1f, 0.0001f);
+        if (length > 1)
+        {
+            results[^1].Should().Be(0f);
+        }
+    }
+
+    [Fact]
+    public void CalculateIoUs_WithMismatchedLengths_ShouldThrowArgumentException()
+    {
+        // Act & Assert
+        var act = () => SimdMath.CalculateIoUs(0, 0, 1, 1, 1,
+            new float[4], new float[4], new float[4], new float[4], new float[4], new float[3]);
+        act.Should().Throw<ArgumentException>();
+    }
+
+    [Theory]
+    [InlineData(1)]
+    [InlineData(15)]
+    [InlineData(16)]
+    [InlineData(17)]
+    [InlineData(640)]
+    public void NormalizeRgbToPlanes_ShouldSplitAndScaleChannels(int pixelCount)
+    {
+        // Arrange
+        var random = new Random(5);
+        var rgb = new byte[pixelCount * 3];
+        random.NextBytes(rgb);
+        rgb[0] = 255;
+        var red = new float[pixelCount];
+        var green = new float[pixelCount];
+        var blue = new float[pixelCount];
+
+        // Act
+        SimdMath.NormalizeRgbToPlanes(rgb, red, green, blue);
+
+        // Assert
+        for (int i = 0; i < pixelCount; i++)
+        {
+            red[i].Should().BeApproximately(rgb[i * 3] / 255f, 0.000001f);
+            green[i].Should().BeApproximately(rgb[i * 3 + 1] / 255f, 0.000001f);
+            blue[i].Should().BeApproximately(rgb[i * 3 + 2] / 255f, 0.000001f);
+        }
+        red[0].Should().BeApproximately(1f, 0.000001f);
+    }
+
+    [Fact]
+    public void NormalizeRgbToPlanes_WithPartialPixel_ShouldThrowArgumentException()
+    {
+        // Act & Assert
+        var act = () => SimdMath.NormalizeRgbToPlanes(new byte[4], new float[1], new float[1], new float[1]);
+        act.Should().Throw<ArgumentException>();
+    }
 }
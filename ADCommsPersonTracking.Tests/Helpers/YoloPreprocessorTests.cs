@@ -0,0 +1,77 @@
+using ADCommsPersonTracking.Api.Helpers;
+using FluentAssertions;
+using SixLabors.ImageSharp;
+using SixLabors.ImageSharp.PixelFormats;
+
+namespace ADCommsPersonTracking.Tests.Helpers;
+
+public class YoloPreprocessorTests
+{
+    [Fact]
+    public void WritePlanarRgb_ShouldWriteNormalizedChannelPlanes()
+    {
+        // Arrange
+        using var image = new Image<Rgb24>(2, 1);
+        image[0, 0] = new Rgb24(255, 0, 51);
+        image[1, 0] = new Rgb24(0, 102, 255);
+        var destination = new float[6];
+
+        // Act
+        YoloPreprocessor.WritePlanarRgb(image, destination);
+
+        // Assert - R plane, then G plane, then B plane
+        destination.Should().Equal(
+            new[] { 1f, 0f, 0f, 0.4f, 0.2f, 1f },
+            (actual, expected) => Math.Abs(actual - expected) < 0.0001f);
+    }
+
+    [Fact]
+    public void WritePlanarRgb_WithTooSmallDestination_ShouldThrow()
+    {
+        // Arrange
+        using var image = new Image<Rgb24>(4, 4);
+
+        // Act
+        var act = () => YoloPreprocessor.WritePlanarRgb(image, new float[3 * 4 * 4 - 1]);
+
+        // Assert
+        act.Should().Throw<ArgumentException>();
+    }
+
+    [Fact]
+    public void CreateInputTensor_ShouldReturnNchwTensorAndOriginalSize()
+    {
+        // Arrange
+        using var image = new Image<Rgb24>(320, 200, new Rgb24(255, 255, 255));
+        using var stream = new MemoryStream();
+        image.SaveAsPng(stream);
+
+        // Act
+        var (tensor, originalWidth, originalHeight) = YoloPreprocessor.CreateInputTensor(stream.ToArray(), 64, 32);
+
+        // Assert
+        originalWidth.Should().Be(320);
+        originalHeight.Should().Be(200);
+        tensor.Dimensions.ToArray().Should().Equal(1, 3, 32, 64);
+        tensor[0, 2, 31, 63].Should().BeApproximately(1f, 0.0001f);
+    }
+
+    [Fact]
+    public void CreateInputTensor_WithLargerBuffer_ShouldOnlyUseOneInputsWorth()
+    {
+        // Arrange - pooled buffers are often longer than requested
+        using var image = new Image<Rgb24>(8, 8, new Rgb24(255, 255, 255));
+        using var stream = new MemoryStream();
+        image.SaveAsPng(stream);
+        var buffer = new float[YoloPreprocessor.GetInputLength(8, 8) + 16];
+        Array.Fill(buffer, -1f);
+
+        // Act
+        var (tensor, _, _) = YoloPreprocessor.CreateInputTensor(stream.ToArray(), 8, 8, buffer);
+
+        // Assert
+        tensor.Length.Should().Be(3 * 8 * 8);
+        buffer.Take(3 * 8 * 8).Should().OnlyContain(v => Math.Abs(v - 1f) < 0.0001f);
+        buffer.Skip(3 * 8 * 8).Should().OnlyContain(v => v == -1f);
+    }
+}
@@ -0,0 +1,106 @@
+using ADCommsPersonTracking.Api.Services;
+using FluentAssertions;
+using Microsoft.ML.OnnxRuntime.Tensors;
+
+namespace ADCommsPersonTracking.Tests.Services;
+
+public class InferenceBatcherTests
+{
+    // Stand-in model: output is the input doubled, with the same [batch, 2] shape
+    private static DenseTensor<float> DoubleBatch(DenseTensor<float> batch)
+    {
+        var output = batch.Buffer.ToArray().Select(v => v * 2).ToArray();
+        return new DenseTensor<float>(output, batch.Dimensions);
+    }
+
+    [Fact]
+    public async Task RunAsync_WithConcurrentRequests_ShouldShareOneBatchAndReturnEachSlot()
+    {
+        // Arrange
+        var runs = 0;
+        using var batcher = new InferenceBatcher(new[] { 4, 2 }, TimeSpan.FromMilliseconds(200), batch =>
+        {
+            Interlocked.Increment(ref runs);
+            return DoubleBatch(batch);
+        });
+
+        // Act
+        var results = await Task.WhenAll(
+            batcher.RunAsync(new float[] { 1, 2 }),
+            batcher.RunAsync(new float[] { 3, 4 }),
+            batcher.RunAsync(new float[] { 5, 6 }),
+            batcher.RunAsync(new float[] { 7, 8 }));
+
+        // Assert
+        runs.Should().Be(1);
+        results.Select(r => r.ToArray()).Should().BeEquivalentTo(
+            new[] { new float[] { 2, 4 }, new float[] { 6, 8 }, new float[] { 10, 12 }, new float[] { 14, 16 } },
+            options => options.WithStrictOrdering());
+        results.Should().AllSatisfy(r => r.Dimensions.ToArray().Should().Equal(1, 2));
+    }
+
+    [Fact]
+    public async Task RunAsync_WithPartialBatch_ShouldRunAfterTimeoutWithZeroPadding()
+    {
+        // Arrange
+        float[]? seenBatch = null;
+        using var batcher = new InferenceBatcher(new[] { 3, 2 }, TimeSpan.FromMilliseconds(10), batch =>
+        {
+            seenBatch = batch.Buffer.ToArray();
+            return DoubleBatch(batch);
+        });
+
+        // Act
+        var result = await batcher.RunAsync(new float[] { 1, 2 });
+
+        // Assert
+        result.ToArray().Should().Equal(2, 4);
+        seenBatch.Should().Equal(1, 2, 0, 0, 0, 0);
+    }
+
+    [Fact]
+    public async Task RunAsync_WhenModelThrows_ShouldFaultEveryRequestInTheBatch()
+    {
+        // Arrange
+        using var batcher = new InferenceBatcher(new[] { 2, 2 }, TimeSpan.FromMilliseconds(200),
+            _ => throw new InvalidOperationException("model failed"));
+
+        // Act
+        var first = batcher.RunAsync(new float[] { 1, 2 });
+        var second = batcher.RunAsync(new float[] { 3, 4 });
+
+        // Assert
+        await FluentActions.Awaiting(() => first).Should().ThrowAsync<InvalidOperationException>();
+        await FluentActions.Awaiting(() => second).Should().ThrowAsync<InvalidOperationException>();
+    }
+
+    [Fact]
+    public void RunAsync_WithWrongInputLength_ShouldThrowArgumentException()
+    {
+        // Arrange
+        using var batcher = new InferenceBatcher(new[] { 2, 2 }, TimeSpan.FromMilliseconds(10), DoubleBatch);
+
+        // Act
+        Action act = () => batcher.RunAsync(new float[3]);
+
+        // Assert
+        act.Should().Throw<ArgumentException>();
+    }
+
+    [Fact]
+    public async Task Dispose_ShouldFinishQueuedRequestsAndRejectNewOnes()
+    {
+        // Arrange
+        var batcher = new InferenceBatcher(new[] { 2, 2 }, TimeSpan.FromMilliseconds(50), DoubleBatch);
+        var queued = batcher.RunAsync(new float[] { 1, 2 });
+
+        // Act
+        batcher.Dispose();
+
+        // Assert - the loop has drained the queue before Dispose returns
+        queued.IsCompleted.Should().BeTrue();
+        (await queued).ToArray().Should().Equal(2, 4);
+        Action act = () => batcher.RunAsync(new float[] { 3, 4 });
+        act.Should().Throw<ObjectDisposedException>();
+    }
+}
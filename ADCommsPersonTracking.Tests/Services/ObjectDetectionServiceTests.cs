@@ -3,6 +3,8 @@ using ADCommsPersonTracking.Api.Services;
 using FluentAssertions;
 using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.Logging;
+using Microsoft.ML.OnnxRuntime;
+using Microsoft.ML.OnnxRuntime.Tensors;
 using Moq;
 using SixLabors.ImageSharp;
 using SixLabors.ImageSharp.PixelFormats;
@@ -236,4 +238,125 @@ public class ObjectDetectionServiceTests
         detectedObject.BoundingBox.Label.Should().Be("backpack");
         detectedObject.BoundingBox.Confidence.Should().Be(0.85f);
     }
+
+    [Fact]
+    public void ParseYoloOutput_WithEndToEndOutput_ShouldConvertScaleAndFilterPersonsWithoutNms()
+    {
+        // Arrange - [1, 300, 6] rows of x1, y1, x2, y2, score, class; original image is 2x wide, 1.5x tall
+        var output = CreateEndToEndOutput(
+            (100, 100, 200, 300, 0.9f, 0),   // person
+            (100, 100, 200, 300, 0.9f, 24),  // backpack
+            (400, 400, 450, 450, 0.3f, 0),   // person below the 0.45 threshold
+            (110, 110, 210, 310, 0.8f, 0));  // person overlapping the first one
+
+        // Act
+        var detections = _service.ParseYoloOutput(output, 1280, 960);
+
+        // Assert - both overlapping persons survive: NMS already ran in the graph
+        detections.Should().HaveCount(2);
+        detections[0].X.Should().BeApproximately(200f, 0.001f);
+        detections[0].Y.Should().BeApproximately(150f, 0.001f);
+        detections[0].Width.Should().BeApproximately(200f, 0.001f);
+        detections[0].Height.Should().BeApproximately(300f, 0.001f);
+        detections[0].Confidence.Should().Be(0.9f);
+        detections[0].Label.Should().Be("person");
+        detections[1].Confidence.Should().Be(0.8f);
+        detections[1].X.Should().BeApproximately(220f, 0.001f);
+    }
+
+    [Fact]
+    public void ParseYoloOutputForObjects_WithEndToEndOutput_ShouldKeepPersonsAndAccessoriesWithoutNms()
+    {
+        // Arrange
+        var output = CreateEndToEndOutput(
+            (100, 100, 200, 300, 0.9f, 0),   // person
+            (120, 200, 160, 260, 0.3f, 24),  // backpack, above the 0.25 accessory threshold
+            (400, 400, 450, 450, 0.3f, 0),   // person below the 0.45 threshold
+            (300, 300, 400, 400, 0.9f, 2),   // car, not of interest
+            (105, 105, 205, 305, 0.8f, 0));  // person overlapping the first one
+
+        // Act
+        var detections = _service.ParseYoloOutputForObjects(output, 640, 640);
+
+        // Assert
+        detections.Select(d => d.ClassId).Should().Equal(0, 24, 0);
+        detections[1].ObjectType.Should().Be("backpack");
+        detections[1].BoundingBox.X.Should().BeApproximately(120f, 0.001f);
+        detections[1].BoundingBox.Width.Should().BeApproximately(40f, 0.001f);
+        detections[1].BoundingBox.Height.Should().BeApproximately(60f, 0.001f);
+    }
+
+    [Fact]
+    public void ParseYoloOutput_WithRawOutput_ShouldUseOnlyThePersonScoreAndSuppressOverlaps()
+    {
+        // Arrange - raw [1, 84, N] output at the original 640x640 size
+        const int numDetections = 8;
+        var data = new float[84 * numDetections];
+        void SetDetection(int index, float cx, float cy, float w, float h, float personScore)
+        {
+            data[index] = cx;
+            data[numDetections + index] = cy;
+            data[2 * numDetections + index] = w;
+            data[3 * numDetections + index] = h;
+            data[4 * numDetections + index] = personScore;
+        }
+
+        SetDetection(0, 100, 100, 50, 50, 0.45f);  // exactly at the threshold
+        SetDetection(1, 400, 400, 50, 50, 0.6f);
+        data[(4 + 24) * numDetections + 1] = 0.9f; // backpack outscores person on the same box
+        SetDetection(2, 250, 250, 100, 100, 0.9f);
+        SetDetection(3, 255, 255, 100, 100, 0.7f); // overlaps detection 2
+        var output = new DenseTensor<float>(data, new[] { 1, 84, numDetections });
+
+        // Act
+        var detections = _service.ParseYoloOutput(output, 640, 640);
+
+        // Assert - highest confidence first; the weaker overlapping box is suppressed
+        detections.Select(d => d.Confidence).Should().Equal(0.9f, 0.6f, 0.45f);
+        detections[0].X.Should().BeApproximately(200f, 0.001f);
+        detections[0].Y.Should().BeApproximately(200f, 0.001f);
+        detections[1].X.Should().BeApproximately(375f, 0.001f);
+        detections.Should().OnlyContain(d => d.Label == "person");
+    }
+
+    [Fact]
+    public void ToHalfTensor_ShouldConvertValuesAndKeepShape()
+    {
+        // Arrange - values exactly representable in FP16
+        var input = new DenseTensor<float>(new[] { 0f, 0.5f, 1f, 0.25f, 0.125f, 0.75f }, new[] { 1, 3, 1, 2 });
+
+        // Act
+        var half = ObjectDetectionService.ToHalfTensor(input);
+
+        // Assert
+        half.Dimensions.ToArray().Should().Equal(1, 3, 1, 2);
+        half.Buffer.ToArray().Select(v => (float)v).Should().Equal(0f, 0.5f, 1f, 0.25f, 0.125f, 0.75f);
+    }
+
+    [Fact]
+    public void ToFloatTensor_ShouldReadBackHalfOutputAndKeepShape()
+    {
+        // Arrange - 0.45 is not exactly representable, so it comes back within FP16 precision
+        var values = new[] { 320f, 0.45f, -2f, 0.9f };
+        var half = new DenseTensor<Float16>(values.Select(v => (Float16)v).ToArray(), new[] { 1, 2, 2 });
+
+        // Act
+        var output = ObjectDetectionService.ToFloatTensor(half);
+
+        // Assert
+        output.Dimensions.ToArray().Should().Equal(1, 2, 2);
+        output.Buffer.ToArray().Should().Equal(values, (actual, expected) => Math.Abs(actual - expected) <= Math.Abs(expected) * 0.001f);
+    }
+
+    private static DenseTensor<float> CreateEndToEndOutput(params (float X1, float Y1, float X2, float Y2, float Score, int ClassId)[] rows)
+    {
+        var data = new float[300 * 6];
+        for (int i = 0; i < rows.Length; i++)
+        {
+            var row = rows[i];
+            new[] { row.X1, row.Y1, row.X2, row.Y2, row.Score, row.ClassId }.CopyTo(data, i * 6);
+        }
+
+        return new DenseTensor<float>(data, new[] { 1, 300, 6 });
+    }
 }
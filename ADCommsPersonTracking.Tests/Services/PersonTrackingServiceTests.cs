@@ -398,6 +398,38 @@ public class PersonTrackingServiceTests
         result.ProcessingMessage.Should().Contain("0 person detections");
     }
 
+    [Fact]
+    public async Task ProcessFrameAsync_WithTruncatedJpeg_LeavesDecodeErrorsToDetectorAndReturnsEmptyResult()
+    {
+        // Arrange - keep the headers but cut off most of the scan data
+        var imageBytes = CreateTestImage(640, 480);
+        var truncatedBytes = imageBytes.Take(imageBytes.Length / 2).ToArray();
+        var request = new TrackingRequest
+        {
+            ImagesBase64 = new List<string> { Convert.ToBase64String(truncatedBytes) },
+            Prompt = "Find a person wearing a green jacket",
+            Timestamp = DateTime.UtcNow
+        };
+
+        _featureExtractorMock
+            .Setup(s => s.ExtractFeatures(It.IsAny<string>()))
+            .Returns(CreateTestSearchCriteria());
+
+        // Dimensions only come from the header, so the pixels are first decoded by the detector
+        _detectionServiceMock
+            .Setup(s => s.DetectObjectsAsync(It.IsAny<byte[]>()))
+            .ThrowsAsync(new InvalidImageContentException("Truncated JPEG"));
+
+        // Act
+        var result = await _service.ProcessFrameAsync(request);
+
+        // Assert
+        _detectionServiceMock.Verify(s => s.DetectObjectsAsync(It.Is<byte[]>(b => b.SequenceEqual(truncatedBytes))), Times.Once);
+        result.Results.Should().HaveCount(1);
+        result.Results[0].Detections.Should().BeEmpty();
+        result.Results[0].AnnotatedImageBase64.Should().BeEmpty();
+    }
+
     private TrackingRequest CreateTestRequest()
     {
         var imageBytes = CreateTestImage(640, 480);
@@ -6,63 +6,102 @@ Creates:
 2. A simple image with a person-like shape (for basic testing)
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from PIL import Image, ImageDraw
 import os
 
+# Second Huffman pass + 4:2:0 chroma subsampling keeps the committed test images small
+JPEG_OPTIONS = {"quality": 85, "optimize": True, "subsampling": 2, "progressive": True}
+
+# Encode with libjpeg-turbo's SIMD encoder when PyTurboJPEG is installed (pip install PyTurboJPEG)
+try:
+    from turbojpeg import TJFLAG_PROGRESSIVE, TJPF_RGB, TJSAMP_420, TurboJPEG
+    turbo_jpeg = TurboJPEG()
+except (ImportError, RuntimeError, OSError):  # Package or libturbojpeg not available
+    turbo_jpeg = None
+
+def save_jpeg(image, path):
+    """Save an RGB image as JPEG, using libjpeg-turbo when available and Pillow otherwise."""
+    if turbo_jpeg is None:
+        image.save(path, 'JPEG', **JPEG_OPTIONS)
+        return
+    data = turbo_jpeg.encode(np.asarray(image), quality=JPEG_OPTIONS["quality"], pixel_format=TJPF_RGB,
+                             jpeg_subsample=TJSAMP_420, flags=TJFLAG_PROGRESSIVE)
+    with open(path, 'wb') as f:
+        f.write(data)
+
 def create_test_images():
     """Create test images for integration tests."""
     output_dir = "ADCommsPersonTracking.Tests/TestData/Images"
     os.makedirs(output_dir, exist_ok=True)
     
     # Image 1: No person - solid blue background
-    print("Creating test image without person...")
-    img_no_person = Image.new('RGB', (640, 480), color=(135, 206, 235))  # Sky blue
-    no_person_path = os.path.join(output_dir, "no_person.jpg")
-    img_no_person.save(no_person_path, 'JPEG')
-    print(f"✓ Created: {no_person_path}")
+    def build_no_person():
+        img_no_person = Image.new('RGB', (640, 480), color=(135, 206, 235))  # Sky blue
+        no_person_path = os.path.join(output_dir, "no_person.jpg")
+        save_jpeg(img_no_person, no_person_path)
+        return no_person_path
     
     # Image 2: Simple person-like shape (rectangle approximating a person)
-    print("Creating test image with person-like shape...")
-    img_person = Image.new('RGB', (640, 480), color=(200, 200, 200))  # Light gray background
-    draw = ImageDraw.Draw(img_person)
-    
-    # Draw a person-like shape (head + body)
-    # Head (circle approximation)
-    head_x, head_y = 320, 150
-    head_radius = 30
-    draw.ellipse([head_x - head_radius, head_y - head_radius, 
-                  head_x + head_radius, head_y + head_radius], 
-                 fill=(255, 220, 177))  # Skin tone
-    
-    # Body (rectangle)
-    body_left, body_top = 280, 180
-    body_right, body_bottom = 360, 380
-    draw.rectangle([body_left, body_top, body_right, body_bottom], 
-                   fill=(50, 100, 200))  # Blue shirt
-    
-    # Legs (two rectangles)
-    draw.rectangle([280, 380, 315, 450], fill=(50, 50, 50))  # Left leg
-    draw.rectangle([325, 380, 360, 450], fill=(50, 50, 50))  # Right leg
-    
-    person_path = os.path.join(output_dir, "person.jpg")
-    img_person.save(person_path, 'JPEG')
-    print(f"✓ Created: {person_path}")
+    def build_person():
+        person = np.full((480, 640, 3), 200, dtype=np.uint8)  # Light gray background
+        
+        # Draw a person-like shape (head + body) straight into the pixel buffer
+        # Head (circle); the mask is rasterized by ImageDraw.ellipse on a small bitmap, so its
+        # edge pixels match drawing the ellipse on the full image
+        head_x, head_y = 320, 150
+        head_radius = 30
+        head_bitmap = Image.new('1', (2 * head_radius + 1, 2 * head_radius + 1))
+        ImageDraw.Draw(head_bitmap).ellipse([0, 0, 2 * head_radius, 2 * head_radius], fill=1)
+        head_mask = np.asarray(head_bitmap, dtype=bool)
+        person[head_y - head_radius:head_y + head_radius + 1,
+               head_x - head_radius:head_x + head_radius + 1][head_mask] = (255, 220, 177)  # Skin tone
+        
+        # Body (rectangle)
+        body_left, body_top = 280, 180
+        body_right, body_bottom = 360, 380
+        person[body_top:body_bottom + 1, body_left:body_right + 1] = (50, 100, 200)  # Blue shirt
+        
+        # Legs (two rectangles)
+        person[380:451, 280:316] = (50, 50, 50)  # Left leg
+        person[380:451, 325:361] = (50, 50, 50)  # Right leg
+        img_person = Image.fromarray(person, 'RGB')
+        
+        person_path = os.path.join(output_dir, "person.jpg")
+        save_jpeg(img_person, person_path)
+        return person_path
     
     # Image 3: Empty scene (gradient background)
-    print("Creating test image with gradient background...")
-    img_gradient = Image.new('RGB', (640, 480))
-    pixels = img_gradient.load()
-    for y in range(480):
-        for x in range(640):
-            # Create a gradient effect
-            r = int((x / 640) * 255)
-            g = int((y / 480) * 255)
-            b = 128
-            pixels[x, y] = (r, g, b)
+    def build_gradient():
+        # Create a gradient effect: red follows x, green follows y, blue is constant
+        x = np.arange(640, dtype=np.uint32)
+        y = np.arange(480, dtype=np.uint32)
+        gradient = np.empty((480, 640, 3), dtype=np.uint8)
+        gradient[..., 0] = ((x * 255) // 640).astype(np.uint8)[np.newaxis, :]
+        gradient[..., 1] = ((y * 255) // 480).astype(np.uint8)[:, np.newaxis]
+        gradient[..., 2] = 128
+        img_gradient = Image.fromarray(gradient, 'RGB')
+        
+        gradient_path = os.path.join(output_dir, "empty_scene.jpg")
+        save_jpeg(img_gradient, gradient_path)
+        return gradient_path
     
-    gradient_path = os.path.join(output_dir, "empty_scene.jpg")
-    img_gradient.save(gradient_path, 'JPEG')
-    print(f"✓ Created: {gradient_path}")
+    builds = [
+        ("without person", build_no_person),
+        ("with person-like shape", build_person),
+        ("with gradient background", build_gradient),
+    ]
+
+    # libjpeg releases the GIL while encoding, so the three images build in parallel;
+    # the workers return their paths and only this thread prints, so lines don't interleave
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = []
+        for description, build in builds:
+            print(f"Creating test image {description}...")
+            futures.append(executor.submit(build))
+        for future in futures:
+            print(f"✓ Created: {future.result()}")  # Re-raises any error from the worker thread
     
     print("\n✓ All test images created successfully!")
 
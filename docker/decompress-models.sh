@@ -0,0 +1,32 @@
+#!/bin/sh
+# Decompress model artifacts written with MODEL_COMPRESSION=zstd, then run the given command.
+# Use as the entrypoint of a container that consumes /models, e.g.:
+#   ENTRYPOINT ["/decompress-models.sh"]
+#   CMD ["dotnet", "ADCommsPersonTracking.Api.dll"]
+# Set MODELS_OUTPUT_DIR (e.g. /dev/shm/models) to decompress into another directory and keep the
+# compressed files, which suits read-only model volumes.
+set -e
+
+MODELS_DIR="${MODELS_DIR:-/models}"
+MODELS_OUTPUT_DIR="${MODELS_OUTPUT_DIR:-$MODELS_DIR}"
+mkdir -p "$MODELS_OUTPUT_DIR"
+
+for compressed in "$MODELS_DIR"/*.zst; do
+    [ -e "$compressed" ] || continue
+    name="$(basename "$compressed" .zst)"
+    if [ "$MODELS_OUTPUT_DIR" = "$MODELS_DIR" ]; then
+        zstd -d -q -f --rm "$compressed"
+    else
+        zstd -d -q -f "$compressed" -o "$MODELS_OUTPUT_DIR/$name"
+    fi
+    echo "Decompressed $name"
+done
+
+# Execution provider hints are stored uncompressed and must sit next to their model
+if [ "$MODELS_OUTPUT_DIR" != "$MODELS_DIR" ]; then
+    for hints in "$MODELS_DIR"/*.meta.json; do
+        [ -e "$hints" ] && cp "$hints" "$MODELS_OUTPUT_DIR/"
+    done
+fi
+
+exec "$@"
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""Export YOLO models to ONNX format, optionally with FP16 and INT8 variants.
+
+Usage:
+    python export.py --model yolo11x --half --int8
+    python export.py --model yolo11n --model yolo11m --model yolo11x --output-dir /models
+    python export.py --model fashion-yolo --output /models/fashion-yolo.onnx
+    python export.py --model yolo11x --nms
+
+Several --model flags are exported by one interpreter, so torch and ultralytics are
+imported once. The module can also be imported and export_model() called directly.
+"""
+
+from pathlib import Path
+import argparse
+import errno
+import importlib.util
+import json
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+
+DEFAULT_MODEL = "yolo11x"
+
+# Output names that are not Ultralytics model names, mapped to the weights they are exported from
+MODEL_SOURCES = {
+    "fashion-yolo": "keremberke/yolov8m-fashion-detection",
+}
+
+# In-graph NMS settings: keep everything the API could accept (its lowest default threshold is the
+# 0.25 accessory threshold) and suppress with the same IoU threshold the API uses
+NMS_CONFIDENCE = 0.25
+NMS_IOU = 0.5
+
+# Both INT8 paths keep the stem conv in FP32; quantizing it collapses accuracy
+INT8_EXCLUDED_NODES = ["/model.0/conv/Conv"]
+
+# Weights are downloaded to (and reused from) here. The export image points YOLO_CONFIG_DIR at
+# /root/.cache/ultralytics, so a volume mounted at /root/.cache keeps them across runs.
+weights_dir = Path(os.environ["YOLO_CONFIG_DIR"]) / "weights" if "YOLO_CONFIG_DIR" in os.environ else Path.cwd()
+
+
+def move_into_place(src, dst):
+    """Move src to dst with a single atomic rename, copying only if they are on different filesystems."""
+    try:
+        src.replace(dst)
+    except OSError as e:
+        # The output directory is often a bind mount, so the export may sit on another filesystem
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
+def load_calibration_frames(image_dir, size=640):
+    """Load sample frames as 1x3xHxW float32 tensors, preprocessed like the API does."""
+    import numpy as np
+    from PIL import Image
+
+    frames = []
+    for path in sorted(image_dir.glob("*")):
+        if path.suffix.lower() not in (".jpg", ".jpeg", ".png"):
+            continue
+        image = Image.open(path).convert("RGB").resize((size, size))
+        array = np.asarray(image, dtype=np.float32) / 255.0
+        frames.append(array.transpose(2, 0, 1)[np.newaxis, ...])
+    return frames
+
+
+def prune_initializers(model):
+    """Drop initializers (and their shadowing graph inputs) that no node or graph output reads."""
+    graph = model.graph
+    used = {name for node in graph.node for name in node.input} | {o.name for o in graph.output}
+    unused = {t.name for t in graph.initializer} - used
+    # Repeated protobuf fields don't support slice assignment; delete in place, back to front
+    for field in (graph.initializer, graph.input):
+        for index in reversed(range(len(field))):
+            if field[index].name in unused:
+                del field[index]
+    return model
+
+
+def simplify_graph(path):
+    """Simplify and constant-fold the exported graph with onnxsim, then apply onnxoptimizer fusions."""
+    import onnx
+    import onnxoptimizer
+    import onnxsim
+
+    model, ok = onnxsim.simplify(onnx.load(str(path)), perform_optimization=True)
+    if not ok:
+        print("onnxsim could not validate the simplified graph; keeping the exported graph")
+        return
+    model = onnxoptimizer.optimize(model, ["fuse_bn_into_conv", "fuse_add_bias_into_conv",
+                                           "eliminate_deadend", "eliminate_identity"])
+    onnx.save(prune_initializers(model), str(path))
+
+
+def convert_fp16(src, dst):
+    """Write an FP16 copy of the FP32 ONNX model at src to dst, keeping FP32 inputs/outputs."""
+    import onnx
+    from onnxconverter_common import float16
+
+    model = float16.convert_float_to_float16(onnx.load(str(src)), keep_io_types=True)
+    onnx.save(model, str(dst))
+
+
+def quantize_int8(src, dst, calibration_dir, imgsz=640, batch=1):
+    """Write an INT8 copy of the FP32 ONNX model at src to dst."""
+    import numpy as np
+    import onnx
+    from onnxruntime.quantization import CalibrationDataReader, QuantType, quantize_dynamic, quantize_static
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+
+    input_name = onnx.load(str(src)).graph.input[0].name
+    frames = load_calibration_frames(calibration_dir, imgsz) if calibration_dir.is_dir() else []
+    # Fixed-batch models take exactly `batch` frames per run; wrap around to fill the last batch
+    batches = [np.concatenate([frames[(start + k) % len(frames)] for k in range(batch)])
+               for start in range(0, len(frames), batch)]
+
+    # Symbolic shape inference + constant folding first, so the runtime can fuse the Q/DQ pairs
+    pre_path = src.with_suffix(".pre.onnx")
+    quant_pre_process(input_model_path=str(src), output_model_path=str(pre_path), skip_symbolic_shape=False)
+
+    try:
+        if frames:
+            class FrameReader(CalibrationDataReader):
+                def __init__(self):
+                    self._frames = iter(batches)
+
+                def get_next(self):
+                    frame = next(self._frames, None)
+                    return None if frame is None else {input_name: frame}
+
+            print(f"Quantizing to INT8 (static, {len(frames)} calibration frames)...")
+            quantize_static(str(pre_path), str(dst), FrameReader(), weight_type=QuantType.QInt8,
+                            nodes_to_exclude=INT8_EXCLUDED_NODES)
+        else:
+            print("Quantizing to INT8 (dynamic, no calibration frames found)...")
+            quantize_dynamic(str(pre_path), str(dst), weight_type=QuantType.QInt8,
+                             nodes_to_exclude=INT8_EXCLUDED_NODES)
+    finally:
+        pre_path.unlink(missing_ok=True)
+
+
+def quantize_int4(src, dst):
+    """Write a 4-bit weight-only (MatMulNBits) copy of the FP32 ONNX model at src to dst.
+
+    Only MatMul nodes with constant weights are quantized. Returns False, writing nothing,
+    if the graph has none.
+    """
+    import onnx
+    from onnxruntime.quantization.matmul_nbits_quantizer import MatMulNBitsQuantizer
+
+    quantizer = MatMulNBitsQuantizer(onnx.load(str(src)), bits=4, block_size=128, is_symmetric=True)
+    quantizer.process()
+    model = quantizer.model.model
+    if not any(node.op_type == "MatMulNBits" for node in model.graph.node):
+        return False
+
+    data_path = dst.with_name(dst.name + ".data")
+    data_path.unlink(missing_ok=True)
+    onnx.save_model(model, str(dst), save_as_external_data=True, all_tensors_to_one_file=True,
+                    location=data_path.name, size_threshold=1024)
+    make_readable(data_path)
+    return True
+
+
+def optimize_graph(path):
+    """Persist ONNX Runtime's offline graph optimizations (node fusions) into the model at path."""
+    import onnxruntime as ort
+
+    optimized_path = path.with_suffix(".opt.onnx")
+    options = ort.SessionOptions()
+    # EXTENDED rather than ALL: layout optimizations are hardware-specific and unsafe to save offline
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    options.optimized_model_filepath = str(optimized_path)
+    # Constructing the session writes the optimized graph to disk
+    ort.InferenceSession(str(path), options, providers=["CPUExecutionProvider"])
+    os.replace(optimized_path, path)
+
+
+def save_ort_format(path):
+    """Write an ORT-format copy of the model at path (<stem>.ort) that loads without re-optimizing the graph."""
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    # EXTENDED for the same reason as optimize_graph: ALL would bake in layouts for the export host's CPU
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    options.optimized_model_filepath = str(path.with_suffix(".ort"))
+    options.add_session_config_entry("session.save_model_format", "ORT")
+    ort.InferenceSession(str(path), options, providers=["CPUExecutionProvider"])
+
+
+def save_with_external_data(path):
+    """Re-save the model at path with its weights in a <name>.data sidecar next to it."""
+    import onnx
+
+    # Ultralytics exports (and ORT fusions) can leave weights behind that no node reads any more
+    model = prune_initializers(onnx.load(str(path)))
+    data_path = path.with_name(path.name + ".data")
+    # onnx appends to an existing sidecar, so start from a clean file
+    data_path.unlink(missing_ok=True)
+    onnx.save_model(model, str(path), save_as_external_data=True, all_tensors_to_one_file=True,
+                    location=data_path.name, size_threshold=1024, convert_attribute=False)
+    make_readable(data_path)
+
+
+def make_readable(path):
+    """Give the file at path the 0644 mode of the other exported artifacts.
+
+    onnx creates external-data sidecars with mode 0600. The export runs as root, so the API,
+    which runs as a non-root user, could not read the weights of the exported .onnx model.
+    """
+    os.chmod(path, 0o644)
+
+
+def write_session_hints(path, precision, imgsz=640, batch=1):
+    """Write a <name>.meta.json next to the model at path with the execution providers to load it with."""
+    # TensorRT only builds reduced-precision engines when asked to; without the flag
+    # it dequantizes back to FP32 and the smaller model buys nothing at inference time
+    tensorrt_options = {"fp16": {"trt_fp16_enable": True}, "int8": {"trt_int8_enable": True}}.get(precision, {})
+    hints = {
+        "providers": [
+            ["TensorrtExecutionProvider", tensorrt_options],
+            ["CUDAExecutionProvider", {}],
+            ["CPUExecutionProvider", {}],
+        ],
+        "input_shape": [batch, 3, imgsz, imgsz],
+        "precision": precision,
+    }
+    path.with_name(path.name + ".meta.json").write_text(json.dumps(hints, indent=2) + "\n")
+
+
+def compress_artifacts(paths):
+    """Compress each existing artifact at paths to <name>.zst with zstd -19, removing the original."""
+    for path in paths:
+        if path.exists():
+            subprocess.run(["zstd", "-19", "-T0", "-q", "-f", "--rm", str(path)], check=True)
+            print(f"Compressed {path.name} to {path.name}.zst")
+
+
+def module_available(name):
+    """Return True if the named module can be imported."""
+    return importlib.util.find_spec(name) is not None
+
+
+def graph_tools_available():
+    """Return True if onnxsim and onnxoptimizer are installed."""
+    return module_available("onnxsim") and module_available("onnxoptimizer")
+
+
+def publish(staging_dir, output_path):
+    """Move the staged artifacts next to output_path, moving the main model file last."""
+    # The API polls for the main model file, so its sidecars and variants must already be in place
+    main_names = {output_path.name, output_path.name + ".zst"}
+    for path in sorted(staging_dir.iterdir(), key=lambda p: p.name in main_names):
+        move_into_place(path, output_path.parent / path.name)
+
+
+def export_model(name=DEFAULT_MODEL, output_path=None, half=False, int8=False, int4=False, imgsz=640,
+                 compress=False, nms=False, batch=1):
+    """Export the named model to output_path (default: models/<name>.onnx).
+
+    With half/int8/int4, <stem>.fp16.onnx, <stem>.int8.onnx and <stem>.int4.onnx variants are written next to it.
+    With nms, NMS is part of the graph and the model outputs [1, 300, 6] rows of x1, y1, x2, y2, score, class.
+    With batch > 1, the model takes a fixed batch of that many images, for hosts that batch requests.
+    Sample frames (jpg/png) in a calibration/ directory next to output_path are used for static
+    INT8 calibration; without them dynamic quantization is used.
+    """
+    output_path = Path(output_path or Path("models") / f"{name}.onnx")
+    output_dir = output_path.parent
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    for existing in (output_path, output_path.with_name(output_path.name + ".zst")):
+        if existing.exists():
+            size_mb = existing.stat().st_size / (1024 * 1024)
+            print(f"Model already exists at {existing} ({size_mb:.1f} MB)")
+            return
+
+    # Imported here so runs where the model already exists skip the torch/ultralytics import cost
+    from ultralytics import YOLO
+
+    # Build every artifact in a staging directory and publish them once complete,
+    # so nothing reading output_dir ever sees a half-processed model
+    staging_dir = output_dir / f".{output_path.name}.partial"
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    staging_dir.mkdir()
+    stem = output_path.name.removesuffix(".onnx")
+    model_path = staging_dir / output_path.name
+    fp16_model_path = staging_dir / f"{stem}.fp16.onnx"
+    int8_model_path = staging_dir / f"{stem}.int8.onnx"
+    int4_model_path = staging_dir / f"{stem}.int4.onnx"
+
+    try:
+        source = MODEL_SOURCES.get(name) or str(weights_dir / f"{name}.pt")
+        print(f"Downloading and exporting {name} ({source}) to ONNX...")
+        weights_dir.mkdir(parents=True, exist_ok=True)
+        # Prefer simplifying with onnxsim/onnxoptimizer directly; fall back to Ultralytics' built-in pass
+        use_graph_tools = graph_tools_available()
+        nms_args = dict(nms=True, conf=NMS_CONFIDENCE, iou=NMS_IOU) if nms else {}
+        exported = YOLO(source).export(format="onnx", simplify=not use_graph_tools, dynamic=False,
+                                       imgsz=imgsz, batch=batch, **nms_args)
+        if not exported or not Path(exported).exists():
+            raise RuntimeError(f"Export of {name} did not write an ONNX file")
+        move_into_place(Path(exported), model_path)
+
+        if use_graph_tools:
+            print(f"Simplifying {name} graph with onnxsim and onnxoptimizer...")
+            simplify_graph(model_path)
+
+        # Derive the FP16 and INT8 variants from the plain export, before ORT-specific fusions are applied
+        if half:
+            if module_available("onnxconverter_common"):
+                print(f"Converting {name} to FP16...")
+                convert_fp16(model_path, fp16_model_path)
+            else:
+                print("Skipping FP16 conversion: install it with: pip install onnx onnxconverter-common")
+        if int8:
+            if module_available("onnxruntime"):
+                quantize_int8(model_path, int8_model_path, output_dir / "calibration", imgsz, batch)
+            else:
+                print("Skipping INT8 quantization: install it with: pip install onnx onnxruntime sympy")
+        if int4:
+            print(f"Quantizing {name} MatMul weights to 4 bits...")
+            if not quantize_int4(model_path, int4_model_path):
+                # YOLO keeps nearly all of its weights in Conv layers, which MatMulNBits does not cover
+                print(f"Skipping INT4 variant: {name} has no MatMul with constant weights to quantize")
+
+        if module_available("onnxruntime"):
+            print(f"Optimizing {name} FP32 graph with ONNX Runtime...")
+            optimize_graph(model_path)
+        else:
+            print("Skipping graph optimization: onnxruntime package not found.")
+
+        # Keep the weights in a sidecar file so ORT can load them without a second protobuf copy
+        save_with_external_data(model_path)
+
+        # Tell the inference host which execution providers (and precision flags) each variant wants
+        variants = [(model_path, "fp32"), (fp16_model_path, "fp16"), (int8_model_path, "int8"),
+                    (int4_model_path, "int4")]
+        for path, precision in variants:
+            if path.exists():
+                write_session_hints(path, precision, imgsz, batch)
+
+        # Serialized ORT-format sessions skip graph loading and optimization at API startup
+        if module_available("onnxruntime"):
+            for path, precision in variants:
+                if path.exists():
+                    print(f"Saving {path.with_suffix('.ort').name}...")
+                    save_ort_format(path)
+
+        if compress:
+            compress_artifacts([model_path, model_path.with_name(model_path.name + ".data"),
+                                fp16_model_path, int8_model_path,
+                                int4_model_path, int4_model_path.with_name(int4_model_path.name + ".data")]
+                               + [path.with_suffix(".ort") for path, _ in variants])
+
+        publish(staging_dir, output_path)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    for path in sorted(output_dir.glob(f"{stem}.*")):
+        size_mb = path.stat().st_size / (1024 * 1024)
+        print(f"✓ {path} ({size_mb:.1f} MB)")
+
+
+def _export_in_worker(job):
+    """Run one export job in a pool worker, sharing the cores with the other workers."""
+    import torch
+
+    kwargs, workers = job
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) // workers))
+    export_model(**kwargs)
+    return kwargs["name"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", action="append",
+                        help=f"model to export, repeatable (default: {DEFAULT_MODEL}); "
+                             f"Ultralytics names like yolo11n, or one of: {', '.join(MODEL_SOURCES)}")
+    parser.add_argument("--output", type=Path, help="output file, only with a single --model")
+    parser.add_argument("--output-dir", type=Path, default=Path(os.environ.get("MODELS_DIR", "models")),
+                        help="directory for <model>.onnx files (default: $MODELS_DIR or models)")
+    parser.add_argument("--half", action="store_true", help="also write an FP16 <model>.fp16.onnx")
+    parser.add_argument("--int8", action="store_true", help="also write an INT8-quantized <model>.int8.onnx")
+    parser.add_argument("--int4", action="store_true",
+                        help="also write a 4-bit weight-only <model>.int4.onnx (MatMul weights only)")
+    parser.add_argument("--imgsz", type=int, default=640, help="square input size (default: 640)")
+    parser.add_argument("--batch", type=int, default=1,
+                        help="fixed batch size of the exported model (default: 1); the API batches "
+                             "concurrent requests when it is larger")
+    parser.add_argument("--nms", action="store_true",
+                        help="include NMS in the graph so the model outputs final boxes (COCO detectors only; "
+                             "the API's clothing detector expects raw output)")
+    parser.add_argument("--compress", action="store_true", default=os.environ.get("MODEL_COMPRESSION") == "zstd",
+                        help="compress the artifacts to <name>.zst with zstd (default: on if MODEL_COMPRESSION=zstd)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="export this many models in parallel worker processes (default: 1)")
+    args = parser.parse_args(argv)
+
+    args.model = args.model or [DEFAULT_MODEL]
+    if args.output and len(args.model) > 1:
+        parser.error("--output can only be used with a single --model")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    jobs = [dict(name=name, output_path=args.output or args.output_dir / f"{name}.onnx", half=args.half,
+                 int8=args.int8, int4=args.int4, imgsz=args.imgsz, compress=args.compress, nms=args.nms,
+                 batch=args.batch)
+            for name in args.model]
+
+    try:
+        if args.jobs > 1 and len(jobs) > 1:
+            workers = min(args.jobs, len(jobs))
+            # spawn rather than fork: torch's thread pools are not fork-safe once initialized
+            with multiprocessing.get_context("spawn").Pool(workers) as pool:
+                for name in pool.imap_unordered(_export_in_worker, [(job, workers) for job in jobs]):
+                    print(f"{name} export complete!")
+        else:
+            for job in jobs:
+                export_model(**job)
+    except Exception as e:
+        print(f"✗ Export failed: {e}")
+        return 1
+
+    print("Model export complete!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,53 +2,20 @@
 """
 Script to download and export YOLO11x ONNX model from Ultralytics.
 This script uses the Ultralytics Python package to download the PyTorch model
-and export it to ONNX format.
+and export it to ONNX format, along with FP16 and INT8 variants, in models/.
+
+It is a thin wrapper around docker/model-export/export.py; extra arguments are
+passed through, e.g. `python download-model.py --model yolo11n`.
 """
 
-import os
 import sys
 from pathlib import Path
 
-def download_and_export_model():
-    """Download YOLO11x PyTorch model and export to ONNX format."""
-    try:
-        from ultralytics import YOLO
-    except ImportError:
-        print("Error: ultralytics package not found.")
-        print("Please install it with: pip install ultralytics")
-        sys.exit(1)
-    
-    # Define paths
-    model_dir = Path("models")
-    model_path = model_dir / "yolo11x.onnx"
-    
-    # Create models directory if it doesn't exist
-    model_dir.mkdir(exist_ok=True)
-    
-    # Check if model already exists
-    if model_path.exists():
-        size_mb = model_path.stat().st_size / (1024 * 1024)
-        print(f"Model already exists at {model_path} ({size_mb:.1f} MB)")
-        return
-    
-    print("Downloading YOLO11x model and exporting to ONNX...")
-    print("This may take a few minutes...")
-    
-    # Load model (will download if not present)
-    model = YOLO('yolo11x.pt')
-    
-    # Export to ONNX format
-    model.export(format='onnx', simplify=True, dynamic=False, imgsz=640)
-    
-    # Move the exported model to the models directory
-    exported_path = Path("yolo11x.onnx")
-    if exported_path.exists():
-        exported_path.rename(model_path)
-        size_mb = model_path.stat().st_size / (1024 * 1024)
-        print(f"✓ Model successfully exported to {model_path} ({size_mb:.1f} MB)")
-    else:
-        print("✗ Failed to export model")
-        sys.exit(1)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "docker" / "model-export"))
+
+from export import main  # noqa: E402
 
 if __name__ == "__main__":
-    download_and_export_model()
+    # --model is repeatable, so only add the default when no model was given
+    models = [] if any(arg.startswith("--model") for arg in sys.argv[1:]) else ["--model", "yolo11x"]
+    sys.exit(main([*models, "--output-dir", "models", "--half", "--int8", *sys.argv[1:]]))